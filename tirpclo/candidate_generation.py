@@ -1,356 +1,311 @@
-from typing import List, Dict, Optional
-from tirpclo.data_types import TiepProjector, SequenceDB, Coincidence, Tiep, PatternInstance
+from typing import List, Dict, Optional, Sequence, Tuple
+from bisect import bisect_left
+from tirpclo.data_types import TiepProjector, SequenceDB, Coincidence, CoincidenceSequence, Tiep, PatternInstance, STI
 from tirpclo.tiep_index import TiepIndex, MasterTiep
 from tirpclo import constants
-from tirpclo import utils
 
 
 def get_tiep_projectors(
 		seq_db: SequenceDB,
-		pattern_last_tiep: str,
-		previous_tiep_projectors: Dict[str, TiepProjector],
+		pattern_last_tiep_id: int,
+		previous_tiep_projectors: Dict[int, TiepProjector],
 		index: TiepIndex,
 		min_support: int,
 		maximal_gap: int,
 		is_closed_tirp_mining: bool
-) -> Dict[str, TiepProjector]:
+) -> Dict[int, TiepProjector]:
 	"""
 	generates and returns new tiep-projectors based on the previous ones, if exist
 	:param seq_db: (SequenceDB) projected sequence database
-	:param pattern_last_tiep: (str) last tiep of current pattern represented by the sequence database
-	:param previous_tiep_projectors: (Dict[str, TiepProjector]) mapping of all previous tiep-projectors,
+	:param pattern_last_tiep_id: (int) id of last tiep of current pattern represented by the sequence database
+	:param previous_tiep_projectors: (Dict[int, TiepProjector]) mapping of all previous tiep-projectors,
 		based on which new tiep-projectors are created
 	:param index: (TiepIndex) main tiep-index
 	:param min_support: (int) minimum vertical support threshold
 	:param maximal_gap: (int) maximal gap
 	:param is_closed_tirp_mining: (bool) whether mining only closed TIRPs or not
-	:return: (Dict[str, TiepProjector]) new tiep-projectors
+	:return: (Dict[int, TiepProjector]) new tiep-projectors
 	"""
 
+	# get base primitive form of last tiep
+	pattern_last_tiep_id = index.primitive_rep_ids[pattern_last_tiep_id]
+	complement_tiep_id: int = index.master_tieps_list[pattern_last_tiep_id].complement_rep_id
+	is_last_start_tiep: bool = index.reps[pattern_last_tiep_id][-1] == constants.START_REP
+
 	if previous_tiep_projectors is None:
 		# initial tiep-projectors
-		return __get_initial_tiep_projectors(seq_db, pattern_last_tiep, maximal_gap, is_closed_tirp_mining)
-
-	# get base primitive form of last tiep
-	if pattern_last_tiep[0] == constants.CO_REP or pattern_last_tiep[0] == constants.MEET_REP:
-		pattern_last_tiep = pattern_last_tiep[1:]
+		return __get_initial_tiep_projectors(
+			seq_db, pattern_last_tiep_id, complement_tiep_id, maximal_gap, is_closed_tirp_mining
+		)
 
-	tiep_projectors: Dict[str, TiepProjector] = {}
+	tiep_projectors: Dict[int, TiepProjector] = {}
 	allowed_non_supporting_records: int = len(seq_db.db) - min_support
 
 	# populate tiep-projectors based on recent ones
 	__populate_tiep_projectors_based_on_recent(
-		seq_db, pattern_last_tiep, previous_tiep_projectors, index,
+		seq_db, pattern_last_tiep_id, previous_tiep_projectors, index,
 		min_support, maximal_gap, tiep_projectors, allowed_non_supporting_records, is_closed_tirp_mining
 	)
 
-	# if the last tiep was a start tiep, add complement to tiep-projectors
-	if pattern_last_tiep[-1] == constants.START_REP:
-		__add_complement_finish_tiep_to_tiep_projectors(
-			seq_db, pattern_last_tiep, index, tiep_projectors, allowed_non_supporting_records
-		)
-
-	# in case of entire frequent TIRP mining, if the last tiep was a finish tiep, potentially add complement to tiep-projectors
-	if not is_closed_tirp_mining and pattern_last_tiep[-1] == constants.FINISH_REP:
-		__add_complement_start_tiep_to_tiep_projectors(
-			seq_db, pattern_last_tiep, index, maximal_gap, tiep_projectors, allowed_non_supporting_records
-		)
-
-	# add meet & co-occurrence tieps to tiep-projectors
-	entry_index: int = 0
-	for coincidence_seq, pattern_instance in seq_db.db:
-		entity_id: str = coincidence_seq.entity
-		current_coincidence: Optional[Coincidence] = coincidence_seq.first_co
-		if current_coincidence is None:
-			entry_index += 1
-			continue
-		__add_relevant_meet_co_tieps_to_tiep_projectors(
-			current_coincidence, entity_id, entry_index, tiep_projectors, pattern_instance, is_closed_tirp_mining
-		)
-		entry_index += 1
+	# add the complement of the last tiep, i.e., its finish tiep if it was a start tiep, or its start tiep otherwise
+	# in case of entire frequent TIRP mining, as well as meet & co-occurrence tieps to tiep-projectors
+	__add_complement_meet_co_tieps_to_tiep_projectors(
+		seq_db, complement_tiep_id if is_last_start_tiep or not is_closed_tirp_mining else None, is_last_start_tiep,
+		index, maximal_gap, tiep_projectors, allowed_non_supporting_records, is_closed_tirp_mining
+	)
 
 	return tiep_projectors
 
 
 def __populate_tiep_projectors_based_on_recent(
 		seq_db: SequenceDB,
-		pattern_last_tiep: str,
-		previous_tiep_projectors: Dict[str, TiepProjector],
+		pattern_last_tiep_id: int,
+		previous_tiep_projectors: Dict[int, TiepProjector],
 		index: TiepIndex,
 		min_support: int,
 		maximal_gap: int,
-		tiep_projectors: Dict[str, TiepProjector],
+		tiep_projectors: Dict[int, TiepProjector],
 		allowed_non_supporting_records: int,
 		is_closed_tirp_mining: bool
 ) -> None:
 	"""
 	populates newly created tiep-projectors based on recent ones
 	:param seq_db: (SequenceDB) projected sequence database
-	:param pattern_last_tiep: (str) last tiep of current pattern represented by the sequence database
-	:param previous_tiep_projectors: (Dict[str, TiepProjector]) mapping of all previous tiep-projectors,
+	:param pattern_last_tiep_id: (int) id of the base primitive form of last tiep of current pattern
+		represented by the sequence database
+	:param previous_tiep_projectors: (Dict[int, TiepProjector]) mapping of all previous tiep-projectors,
 		based on which new tiep-projectors are created
 	:param index: (TiepIndex) main tiep-index
 	:param min_support: (int) minimum vertical support threshold
 	:param maximal_gap: (int) maximal gap
-	:param tiep_projectors: (Dict[str, TiepProjector]) incrementally populated new tiep-projectors
+	:param tiep_projectors: (Dict[int, TiepProjector]) incrementally populated new tiep-projectors
 	:param (int) allowed_non_supporting_records: maximal allowed number of non-supporting records for
 		a tiep to be surely concluded as infrequent
 	:param is_closed_tirp_mining: (bool) whether mining only closed TIRPs or not
 	:return: (None)
 	"""
 
-	for tiep, previous_tiep_projector in previous_tiep_projectors.items():
+	db: List[Tuple[CoincidenceSequence, PatternInstance]] = seq_db.db
+	first_regular_co_indices: List[int] = seq_db.get_first_regular_co_indices()
+	entries_prev_indices: List[int] = seq_db.entries_prev_indices
+	entries_by_prev_index: Dict[int, List[int]] = seq_db.get_entries_by_prev_index()
+	reps: List[str] = index.reps
+	primitive_rep_ids: List[int] = index.primitive_rep_ids
+	master_tieps_list: List[Optional[MasterTiep]] = index.master_tieps_list
+	finish_rep: str = constants.FINISH_REP
+
+	for tiep_id, previous_tiep_projector in previous_tiep_projectors.items():
 
 		# make sure the tiep has been recently frequent, and does not represent a special case handled separately
 		# (i.e., not a co-occurrence / meet tiep as well as not equal to the pattern last tiep)
 		if len(previous_tiep_projector.supporting_entities) < min_support:
 			continue
-		if tiep[0] == constants.CO_REP or tiep[0] == constants.MEET_REP:
+		if primitive_rep_ids[tiep_id] != tiep_id:
 			continue
 
-		is_finish_tiep: bool = tiep[-1] == constants.FINISH_REP
-		if (not is_closed_tirp_mining or is_finish_tiep) and pattern_last_tiep == tiep:
+		is_finish_tiep: bool = reps[tiep_id][-1] == finish_rep
+		if (not is_closed_tirp_mining or is_finish_tiep) and pattern_last_tiep_id == tiep_id:
 			continue
 
-		master_tiep: MasterTiep = index.master_tieps[tiep]
-		entry_index: int = 0
-		non_supporting_records: int = 0
+		master_tiep: MasterTiep = master_tieps_list[tiep_id]
+		previous_first_indices: Dict[int, int] = previous_tiep_projector.first_indices
+		tiep_projector: Optional[TiepProjector] = None
 
-		for coincidence_seq, pattern_instance in seq_db.db:
+		# only entries projected from entries of the previous tiep-projector may support the tiep, while all
+		# the others are non-supporting records, possibly concluding the tiep as infrequent upfront
+		candidate_entries: List[int] = sorted([
+			entry_index for previous_entry_index in previous_first_indices
+			if previous_entry_index in entries_by_prev_index
+			for entry_index in entries_by_prev_index[previous_entry_index]
+		])
+		non_supporting_records: int = len(db) - len(candidate_entries)
+
+		# the candidate entries of every entity are consecutive, hence the entity-level lookups and the recording of
+		# a supporting entity are done once per entity rather than once per entry
+		last_entity_id: Optional[str] = None
+		is_last_entity_supporting: bool = False
+		tiep_instances: List[Tiep] = []
+		coincidence_indices: List[int] = []
+
+		for entry_index in candidate_entries:
 
 			if non_supporting_records > allowed_non_supporting_records:
 				break
 
 			# reach first non special coincidence
-			entity_id: str = coincidence_seq.entity
-			current_coincidence: Optional[Coincidence] = coincidence_seq.first_co
-			if current_coincidence is None:
+			start_co_index: int = first_regular_co_indices[entry_index]
+			if start_co_index == -1:
 				non_supporting_records += 1
-				entry_index += 1
 				continue
-			if current_coincidence.is_co:
-				current_coincidence = current_coincidence.next
-				if current_coincidence is None:
-					non_supporting_records += 1
-					entry_index += 1
-					continue
-			if current_coincidence.is_meet:
-				current_coincidence = current_coincidence.next
-				if current_coincidence is None:
-					non_supporting_records += 1
-					entry_index += 1
-					continue
 
-			start_co_index: int = current_coincidence.index
-			previous_entry_index: int = seq_db.entries_prev_indices[entry_index]
-			# if entry is not in previous tiep projector
-			if previous_entry_index not in previous_tiep_projector.first_indices:
-				non_supporting_records += 1
-				entry_index += 1
-				continue
+			coincidence_seq, pattern_instance = db[entry_index]
+			entity_id: str = coincidence_seq.entity
+			prev_start_index: int = previous_first_indices[entries_prev_indices[entry_index]]
+
+			if entity_id != last_entity_id:
+				last_entity_id = entity_id
+				is_last_entity_supporting = False
+				tiep_instances = master_tiep.tiep_occurrences[entity_id]
+				coincidence_indices = master_tiep.get_coincidence_indices(entity_id)
 
-			tiep_instances: List[Tiep] = master_tiep.tiep_occurrences[entity_id]
 			# if it is a finish tiep, check if the projected coincidence sequence includes the specific instance
 			# of the start tiep which complements the current tiep within the pattern instance
 			if not is_closed_tirp_mining and is_finish_tiep:
-				tiep_index: int = pattern_instance.symbol_db_indices[tiep_instances[0].symbol]
-				if tiep_instances[tiep_index].coincidence.index >= start_co_index:
-					__add_tiep_instance_to_tiep_projectors(
-						tiep, entity_id, entry_index, tiep_projectors, tiep_index, validate_first=False
-					)
-				else:
+				first_index: int = pattern_instance.symbol_db_indices[master_tiep.symbol]
+				if tiep_instances[first_index].coincidence.index < start_co_index:
 					non_supporting_records += 1
-				entry_index += 1
-				continue
-
-			# for a start tiep, reach the first instance within the projected coincidence sequence, if exist
-			prev_start_index: int = previous_tiep_projector.first_indices[previous_entry_index]
-			found: bool = False
-			for i in range(prev_start_index, len(tiep_instances)):
-				if not is_finish_tiep and \
-						not utils.max_gap_holds(pattern_instance.minimal_finish_time, tiep_instances[i], maximal_gap):
-					break
-				if tiep_instances[i].coincidence.index >= start_co_index:
-					__add_tiep_instance_to_tiep_projectors(
-						tiep, entity_id, entry_index, tiep_projectors, i, validate_first=is_closed_tirp_mining
-					)
-					found = True
-					break
-			if not found:
-				non_supporting_records += 1
-
-			entry_index += 1
-
-
-def __add_complement_finish_tiep_to_tiep_projectors(
-		seq_db: SequenceDB,
-		pattern_last_tiep: str,
-		index: TiepIndex,
-		tiep_projectors: Dict[str, TiepProjector],
-		allowed_non_supporting_records: int
-) -> None:
-	"""
-	populates newly created tiep-projectors with complementing finish tiep of the pattern last tiep
-	:param seq_db: (SequenceDB) projected sequence database
-	:param pattern_last_tiep: (str) last tiep of current pattern represented by the sequence database
-	:param index: (TiepIndex) main tiep-index
-	:param tiep_projectors: (Dict[str, TiepProjector]) incrementally populated new tiep-projectors
-	:param (int) allowed_non_supporting_records: maximal allowed number of non-supporting records for
-		a tiep to be surely concluded as infrequent
-	:return: (None)
-	"""
-
-	finish_tiep_rep: str = pattern_last_tiep.replace(constants.START_REP, constants.FINISH_REP)
-	master_tiep: MasterTiep = index.master_tieps[finish_tiep_rep]
-	entry_index: int = 0
-	non_supporting_records: int = 0
-
-	for coincidence_seq, pattern_instance in seq_db.db:
-		if non_supporting_records > allowed_non_supporting_records:
-			break
-
-		# reach first non special coincidence
-		entity_id: str = coincidence_seq.entity
-		current_coincidence: Optional[Coincidence] = coincidence_seq.first_co
-		if current_coincidence is None:
-			non_supporting_records += 1
-			entry_index += 1
-			continue
-		if current_coincidence.is_co:
-			current_coincidence = current_coincidence.next
-			if current_coincidence is None:
-				non_supporting_records += 1
-				entry_index += 1
-				continue
+					continue
 
-		# add the specific finish tiep complementing the recently added start tiep for each record
-		start_co_index: int = current_coincidence.index
-		tiep_instances: List[Tiep] = master_tiep.tiep_occurrences[entity_id]
-		tiep_index: int = pattern_instance.symbol_db_indices[tiep_instances[0].symbol]
-		if tiep_instances[tiep_index].coincidence.index >= start_co_index:
-			__add_tiep_instance_to_tiep_projectors(
-				finish_tiep_rep, entity_id, entry_index, tiep_projectors, tiep_index, validate_first=False
-			)
-		else:
-			non_supporting_records += 1
+			else:
+				# for a start tiep, reach the first instance within the projected coincidence sequence, if exist;
+				# as both the coincidence indices and the start times of the instances are non-decreasing, it is the first
+				# instance whose coincidence is not before the sequence start, provided that it satisfies the maximal gap
+				first_index: int = bisect_left(coincidence_indices, start_co_index, prev_start_index)
+				if first_index >= len(tiep_instances) or (not is_finish_tiep and tiep_instances[first_index].time >=
+						pattern_instance.minimal_finish_time + maximal_gap):
+					non_supporting_records += 1
+					continue
 
-		entry_index += 1
+			# as the tiep-projectors are first populated here, every entry is recorded at most once
+			if tiep_projector is None:
+				tiep_projector = TiepProjector()
+				tiep_projectors[tiep_id] = tiep_projector
+			if not is_last_entity_supporting:
+				is_last_entity_supporting = True
+				tiep_projector.supporting_entities.add(entity_id)
+			tiep_projector.first_indices[entry_index] = first_index
 
 
-def __add_complement_start_tiep_to_tiep_projectors(
+def __add_complement_meet_co_tieps_to_tiep_projectors(
 		seq_db: SequenceDB,
-		pattern_last_tiep: str,
+		complement_tiep_id: Optional[int],
+		is_complement_finish_tiep: bool,
 		index: TiepIndex,
 		maximal_gap: int,
-		tiep_projectors: Dict[str, TiepProjector],
-		allowed_non_supporting_records: int
+		tiep_projectors: Dict[int, TiepProjector],
+		allowed_non_supporting_records: int,
+		is_closed_tirp_mining: bool
 ) -> None:
 	"""
-	populates newly created tiep-projectors with complementing start tiep of the pattern last tiep
+	populates newly created tiep-projectors with the complementing tiep of the pattern last tiep, if given,
+		as well as with meet & co-occurrence tieps, in a single pass over the sequence database
 	:param seq_db: (SequenceDB) projected sequence database
-	:param pattern_last_tiep: (str) last tiep of current pattern represented by the sequence database
+	:param complement_tiep_id: (Optional[int]) id of the tiep complementing the pattern last tiep, if to be added
+	:param is_complement_finish_tiep: (bool) whether the complementing tiep is a finish tiep (i.e., the pattern last
+		tiep is a start tiep) or a start tiep
 	:param index: (TiepIndex) main tiep-index
 	:param maximal_gap: (int) maximal gap
-	:param tiep_projectors: (Dict[str, TiepProjector]) incrementally populated new tiep-projectors
+	:param tiep_projectors: (Dict[int, TiepProjector]) incrementally populated new tiep-projectors
 	:param (int) allowed_non_supporting_records: maximal allowed number of non-supporting records for
 		a tiep to be surely concluded as infrequent
+	:param is_closed_tirp_mining: (bool) whether mining only closed TIRPs or not
 	:return: (None)
 	"""
 
-	start_tiep: str = pattern_last_tiep.replace(constants.FINISH_REP, constants.START_REP)
-	master_tiep: MasterTiep = index.master_tieps[start_tiep]
+	is_adding_complement: bool = complement_tiep_id is not None
+	master_tiep: Optional[MasterTiep] = index.master_tieps_list[complement_tiep_id] if is_adding_complement else None
 	non_supporting_records: int = 0
-	entry_index: int = 0
+	first_non_co_indices: List[int] = seq_db.get_first_non_co_indices()
+	first_regular_co_indices: List[int] = seq_db.get_first_regular_co_indices()
 
-	for coincidence_seq, pattern_instance in seq_db.db:
-		if non_supporting_records > allowed_non_supporting_records:
-			break
-
-		# reach first non special coincidence
+	for entry_index, (coincidence_seq, pattern_instance) in enumerate(seq_db.db):
 		entity_id: str = coincidence_seq.entity
-		current_coincidence: Optional[Coincidence] = coincidence_seq.first_co
-		if current_coincidence is None:
-			non_supporting_records += 1
-			entry_index += 1
-			continue
-		if current_coincidence.is_co:
-			current_coincidence = current_coincidence.next
-			if current_coincidence is None:
-				non_supporting_records += 1
-				entry_index += 1
-				continue
-		if current_coincidence.is_meet:
-			current_coincidence = current_coincidence.next
-			if current_coincidence is None:
-				non_supporting_records += 1
-				entry_index += 1
-				continue
 
-		start_co_index: int = current_coincidence.index
-		tiep_instances: List[Tiep] = master_tiep.tiep_occurrences[entity_id]
-		tiep_index: int = pattern_instance.tieps[-1].entity_tiep_index + 1
-		found: bool = False
+		if is_adding_complement and non_supporting_records > allowed_non_supporting_records:
+			is_adding_complement = False
 
-		# reach the first instance within the projected coincidence sequence, if exist
-		for i in range(tiep_index, len(tiep_instances)):
-			if not utils.max_gap_holds(pattern_instance.minimal_finish_time, tiep_instances[i], maximal_gap):
-				break
-			if tiep_instances[i].coincidence.index >= start_co_index:
-				__add_tiep_instance_to_tiep_projectors(
-					start_tiep, entity_id, entry_index, tiep_projectors, i, validate_first=False
-				)
-				found = True
-				break
-		if not found:
-			non_supporting_records += 1
+		if is_adding_complement and is_complement_finish_tiep:
+			# add the specific finish tiep complementing the recently added start tiep for each record
+			start_co_index: int = first_non_co_indices[entry_index]
+			if start_co_index == -1:
+				non_supporting_records += 1
+			else:
+				tiep_instances: List[Tiep] = master_tiep.tiep_occurrences[entity_id]
+				tiep_index: int = pattern_instance.symbol_db_indices[master_tiep.symbol]
+				if tiep_instances[tiep_index].coincidence.index >= start_co_index:
+					__add_tiep_instance_to_tiep_projectors(
+						complement_tiep_id, entity_id, entry_index, tiep_projectors, tiep_index, validate_first=False
+					)
+				else:
+					non_supporting_records += 1
 
-		entry_index += 1
+		elif is_adding_complement:
+			# reach the first instance of the complementing start tiep within the projected coincidence sequence,
+			# if exist
+			start_co_index: int = first_regular_co_indices[entry_index]
+			if start_co_index == -1:
+				non_supporting_records += 1
+			else:
+				tiep_instances: List[Tiep] = master_tiep.tiep_occurrences[entity_id]
+				tiep_index: int = pattern_instance.tieps[-1].entity_tiep_index + 1
+				i: int = bisect_left(master_tiep.get_coincidence_indices(entity_id), start_co_index, tiep_index)
+				if i < len(tiep_instances) and \
+						tiep_instances[i].time < pattern_instance.minimal_finish_time + maximal_gap:
+					__add_tiep_instance_to_tiep_projectors(
+						complement_tiep_id, entity_id, entry_index, tiep_projectors, i, validate_first=False
+					)
+				else:
+					non_supporting_records += 1
+
+		current_coincidence: Optional[Coincidence] = coincidence_seq.first_co
+		if current_coincidence is not None:
+			__add_relevant_meet_co_tieps_to_tiep_projectors(
+				current_coincidence, entity_id, entry_index, tiep_projectors, pattern_instance, is_closed_tirp_mining
+			)
 
 
 def __get_initial_tiep_projectors(
 		seq_db: SequenceDB,
-		pattern_last_tiep: str,
+		pattern_last_tiep_id: int,
+		complement_tiep_id: int,
 		maximal_gap: int,
 		is_closed_tirp_mining: bool
-) -> Dict[str, TiepProjector]:
+) -> Dict[int, TiepProjector]:
 	"""
 	generates and returns new tiep-projectors when no previous ones exist
 	:param seq_db: (SequenceDB) projected sequence database
-	:param pattern_last_tiep: (str) last tiep of current pattern represented by the sequence database
+	:param pattern_last_tiep_id: (int) id of last tiep of current pattern represented by the sequence database
+	:param complement_tiep_id: (int) id of the finish tiep complementing the pattern last tiep
 	:param maximal_gap: (int) maximal gap
 	:param is_closed_tirp_mining (bool) whether mining only closed TIRPs or not
-	:return: (Dict[str, TiepProjector]) new tiep-projectors
+	:return: (Dict[int, TiepProjector]) new tiep-projectors
 	"""
 
-	tiep_projectors: Dict[str, TiepProjector] = {}
+	tiep_projectors: Dict[int, TiepProjector] = {}
 	entry_index: int = 0
+	finish_rep: str = constants.FINISH_REP
 
 	for coincidence_seq, pattern_instance in seq_db.db:
-		current_coincidence: Optional[Coincidence] = coincidence_seq.first_co
 		entity_id: str = coincidence_seq.entity
 		found_complement: bool = False
 		beyond_gap: bool = False
+		# the maximal gap holds for a start tiep only if it starts before this bound
+		gap_upper_bound: float = pattern_instance.minimal_finish_time + maximal_gap
 
-		while current_coincidence is not None:
+		for current_coincidence in coincidence_seq.get_coincidences():
 
 			if beyond_gap and found_complement:
 				break
 
-			tieps: List[Tiep] = current_coincidence.tieps
-			is_finish_tieps_coincidence: bool = tieps[0].type == constants.FINISH_REP
+			tieps: Sequence[Tiep] = current_coincidence.tieps
+			is_finish_tieps_coincidence: bool = tieps[0].type == finish_rep
 			# skip finish tieps after the complement of last tiep has been found & start tieps
 			# after violating maximal gap, in case of entire frequent TIRP mining
 			if (found_complement and is_finish_tieps_coincidence) or (beyond_gap and not is_finish_tieps_coincidence):
-				current_coincidence = current_coincidence.next
+				continue
+
+			# all the tieps of a coincidence share the same time, hence the maximal gap is checked once for
+			# all of its start tieps
+			if not is_finish_tieps_coincidence and tieps[0].time >= gap_upper_bound:
+				beyond_gap = True
 				continue
 
 			for current_tiep in tieps:
 				# for a finish tiep, add only if complements last tiep
 				if is_finish_tieps_coincidence:
-					if is_closed_tirp_mining or \
-							pattern_last_tiep == current_tiep.primitive_rep.replace(constants.FINISH_REP, constants.START_REP):
+					if is_closed_tirp_mining or complement_tiep_id == current_tiep.primitive_rep_id:
 						__add_tiep_instance_to_tiep_projectors(
-							current_tiep.primitive_rep, entity_id, entry_index,
+							current_tiep.primitive_rep_id, entity_id, entry_index,
 							tiep_projectors, current_tiep.entity_tiep_index, validate_first=is_closed_tirp_mining
 						)
 						if not is_closed_tirp_mining:
@@ -359,60 +314,59 @@ def __get_initial_tiep_projectors(
 					continue
 
 				# for a start-tiep which differs from the last tiep, add only if does not violate maximal gap
-				if not is_closed_tirp_mining and pattern_last_tiep == current_tiep.primitive_rep:
+				if not is_closed_tirp_mining and pattern_last_tiep_id == current_tiep.primitive_rep_id:
 					continue
-				if not utils.max_gap_holds(pattern_instance.minimal_finish_time, current_tiep, maximal_gap):
-					beyond_gap = True
-					break
 
-				current_tiep_rep: str = (constants.CO_REP if current_coincidence.is_co else '') + current_tiep.primitive_rep
+				current_tiep_rep_id: int = current_tiep.co_rep_id if current_coincidence.is_co else current_tiep.primitive_rep_id
 				current_tiep_orig_tiep: Tiep = current_tiep if current_tiep.orig_tiep is None else current_tiep.orig_tiep
 				__add_tiep_instance_to_tiep_projectors(
-					current_tiep_rep, entity_id, entry_index, tiep_projectors,
+					current_tiep_rep_id, entity_id, entry_index, tiep_projectors,
 					current_tiep_orig_tiep.entity_tiep_index, validate_first=True
 				)
 
-			current_coincidence = current_coincidence.next
-
 		entry_index += 1
 
 	return tiep_projectors
 
 
 def __add_tiep_instance_to_tiep_projectors(
-		tiep_rep: str,
+		tiep_rep_id: int,
 		entity_id: str,
 		entry_index: int,
-		tiep_projectors: Dict[str, TiepProjector],
+		tiep_projectors: Dict[int, TiepProjector],
 		first_index: int,
 		validate_first: bool = False
 ) -> None:
 	"""
 	adds a new tiep instance to the tiep-projector of a tiep
-	:param tiep_rep: (str) tiep representation
+	:param tiep_rep_id: (int) tiep representation id
 	:param entity_id: (str) entity ID
 	:param entry_index: (int) index of entry in sequence database
-	:param tiep_projectors: (Dict[str, TiepProjector]) tiep-projectors
+	:param tiep_projectors: (Dict[int, TiepProjector]) tiep-projectors
 	:param first_index: (int) tiep first index within entry's coincidence sequence
 	:param validate_first: (bool) whether to check or not for an already recorded first index
 	:return:
 	"""
 
-	if tiep_rep not in tiep_projectors:
-		tiep_projectors[tiep_rep] = TiepProjector()
+	tiep_projector: Optional[TiepProjector] = tiep_projectors.get(tiep_rep_id)
+	if tiep_projector is None:
+		tiep_projector = TiepProjector()
+		tiep_projectors[tiep_rep_id] = tiep_projector
 
-	if entity_id not in tiep_projectors[tiep_rep].supporting_entities:
-		tiep_projectors[tiep_rep].supporting_entities.append(entity_id)
+	tiep_projector.supporting_entities.add(entity_id)
 
-	if not validate_first or entry_index not in tiep_projectors[tiep_rep].first_indices:
-		tiep_projectors[tiep_rep].first_indices[entry_index] = first_index
+	# keep an already recorded first index, if validated, within a single probe
+	if validate_first:
+		tiep_projector.first_indices.setdefault(entry_index, first_index)
+	else:
+		tiep_projector.first_indices[entry_index] = first_index
 
 
 def __add_relevant_meet_co_tieps_to_tiep_projectors(
 		current_coincidence: Coincidence,
 		entity_id: str,
 		entry_index: int,
-		tieps_projectors: Dict[str, TiepProjector],
+		tieps_projectors: Dict[int, TiepProjector],
 		pattern_instance: PatternInstance,
 		is_closed_tirp_mining: bool
 ) -> None:
@@ -421,36 +375,39 @@ def __add_relevant_meet_co_tieps_to_tiep_projectors(
 	:param current_coincidence: (Coincidence) current coincidence sequence
 	:param entity_id: (str) entity ID
 	:param entry_index: (int) index of entry in sequence database
-	:param tieps_projectors: (Dict[str, TiepProjector]) tiep-projectors
+	:param tieps_projectors: (Dict[int, TiepProjector]) tiep-projectors
 	:param pattern_instance: (PatternInstance) current pattern instance
 	:param is_closed_tirp_mining (bool) whether mining only closed TIRPs or not
 	:return:
 	"""
 
-	tieps: List[Tiep] = current_coincidence.tieps
+	tieps: Sequence[Tiep] = current_coincidence.tieps
+	pre_matched: Dict[int, STI] = pattern_instance.pre_matched
 
+	# the tieps are added to the tiep-projectors in place, as it is the innermost loop of candidate generation
 	if current_coincidence.is_co:
-		is_finish_tieps_coincidence: bool = current_coincidence.tieps[0].type == constants.FINISH_REP
-		for i in range(len(tieps)):
-			tiep_rep: str = constants.CO_REP + '' + tieps[i].primitive_rep
-			if not is_closed_tirp_mining and is_finish_tieps_coincidence and tieps[i].sti not in pattern_instance.pre_matched:
+		skip_unmatched_finish_tieps: bool = not is_closed_tirp_mining and tieps[0].type == constants.FINISH_REP
+		for current_tiep in tieps:
+			if skip_unmatched_finish_tieps and id(current_tiep.sti) not in pre_matched:
 				continue
-			__add_tiep_instance_to_tiep_projectors(
-				tiep_rep, entity_id, entry_index, tieps_projectors, tieps[i].orig_tiep.entity_tiep_index
-			)
-
-		if current_coincidence.next is not None and current_coincidence.next.is_meet:
-			current_coincidence = current_coincidence.next
-			tieps = current_coincidence.tieps
-			for i in range(len(tieps)):
-				tiep_rep: str = constants.MEET_REP + '' + tieps[i].primitive_rep
-				__add_tiep_instance_to_tiep_projectors(
-					tiep_rep, entity_id, entry_index, tieps_projectors, tieps[i].entity_tiep_index
-				)
-
-	elif current_coincidence.is_meet:
-		for i in range(len(tieps)):
-			tiep_rep: str = constants.MEET_REP + '' + tieps[i].primitive_rep
-			__add_tiep_instance_to_tiep_projectors(
-				tiep_rep, entity_id, entry_index, tieps_projectors, tieps[i].entity_tiep_index
-			)
+			tiep_projector: Optional[TiepProjector] = tieps_projectors.get(current_tiep.co_rep_id)
+			if tiep_projector is None:
+				tiep_projector = TiepProjector()
+				tieps_projectors[current_tiep.co_rep_id] = tiep_projector
+			tiep_projector.supporting_entities.add(entity_id)
+			tiep_projector.first_indices[entry_index] = current_tiep.orig_tiep.entity_tiep_index
+
+		if current_coincidence.next is None or not current_coincidence.next.is_meet:
+			return
+		tieps = current_coincidence.next.tieps
+
+	elif not current_coincidence.is_meet:
+		return
+
+	for current_tiep in tieps:
+		tiep_projector: Optional[TiepProjector] = tieps_projectors.get(current_tiep.meet_rep_id)
+		if tiep_projector is None:
+			tiep_projector = TiepProjector()
+			tieps_projectors[current_tiep.meet_rep_id] = tiep_projector
+		tiep_projector.supporting_entities.add(entity_id)
+		tiep_projector.first_indices[entry_index] = current_tiep.entity_tiep_index
@@ -1,36 +1,40 @@
-from typing import List, Dict, Optional, Tuple
-from tirpclo.data_types import SequenceDB, TiepProjector, BackwardExtensionTiep, Coincidence, Tiep
+from typing import List, Dict, Set, Optional, Tuple
+from tirpclo.data_types import SequenceDB, TiepProjector, BackwardExtensionTiep, Coincidence, Tiep, STI, \
+	CoincidenceSequence, PatternInstance
+from tirpclo.tiep_index import TiepIndex
 from tirpclo import constants
-from tirpclo import utils
 
 
 def may_tirp_be_closed(
 		pattern_seq_db: SequenceDB,
-		tiep_projectors: Dict[str, TiepProjector],
-		be_tieps_lists: Dict[str, List[BackwardExtensionTiep]]
+		tiep_projectors: Dict[int, TiepProjector],
+		be_tieps_lists: Dict[int, List[BackwardExtensionTiep]],
+		index: TiepIndex
 ) -> bool:
 	"""
 	returns whether the TIRP represented by the sequence database may be a closed TIRP or not,
 		based on backward-extension and forward-extension tieps
 	:param pattern_seq_db: (SequenceDB) projected sequence database
-	:param tiep_projectors: (Dict[str, TiepProjector]) tiep-projectors serving as forward-extension tieps
-	:param be_tieps_lists: (Dict[str, List[BackwardExtensionTiep]]) backward-extension tieps
+	:param tiep_projectors: (Dict[int, TiepProjector]) tiep-projectors serving as forward-extension tieps
+	:param be_tieps_lists: (Dict[int, List[BackwardExtensionTiep]]) backward-extension start tieps by symbol
+	:param index: (TiepIndex) main tiep index
 	:return: (bool) whether the TIRP represented by the sequence database may be a closed TIRP or not
 	"""
 
-	for tiep, tiep_projector in tiep_projectors.items():
+	support: int = pattern_seq_db.support
 
-		if pattern_seq_db.support == len(tiep_projector.supporting_entities):
+	for tiep_id, tiep_projector in tiep_projectors.items():
+
+		if support == len(tiep_projector.supporting_entities):
+			tiep: str = index.reps[tiep_id]
 
 			if tiep[-1] == constants.START_REP:
 				return False
 
-			tiep_primitive_rep: str = tiep[1:] if tiep[0] == constants.CO_REP else tiep
-			complement_start_tiep_rep: str = tiep_primitive_rep.replace(constants.FINISH_REP, constants.START_REP)
-			if complement_start_tiep_rep in be_tieps_lists:
-				if __do_be_fe_match_in_all_entities(
-						be_tieps_lists[complement_start_tiep_rep], tiep_projector, pattern_seq_db
-				):
+			# the complementing start tiep has the same symbol
+			symbol: int = index.master_tieps_list[index.primitive_rep_ids[tiep_id]].symbol
+			if symbol in be_tieps_lists:
+				if __do_be_fe_match_in_all_entities(be_tieps_lists[symbol], tiep_projector, pattern_seq_db):
 					return False
 
 	return True
@@ -51,20 +55,24 @@ def __do_be_fe_match_in_all_entities(
 	:return: (bool) whether all entities include an STI which matches the backward and forward-extension tieps
 	"""
 
+	entity_ids: List[str] = pattern_seq_db.get_entity_ids()
+
 	for be_tiep in start_tiep_be_tieps:
-		matching_entities: List[str] = []
+		matching_entities: Set[str] = set()
+
+		be_stis_per_entry: Dict[int, List[STI]] = be_tiep.stis_per_entry
 
 		for db_entry_index, finish_tiep_first_index in finish_fe_tiep_projector.first_indices.items():
-			if db_entry_index in be_tiep.stis_per_entry:
-				entity_id: str = pattern_seq_db.db[db_entry_index][0].entity
+			be_tiep_stis: Optional[List[STI]] = be_stis_per_entry.get(db_entry_index)
+			if be_tiep_stis is not None:
+				entity_id: str = entity_ids[db_entry_index]
 				if entity_id not in matching_entities:
-					for be_tiep_sti in be_tiep.stis_per_entry[db_entry_index]:
+					for be_tiep_sti in be_tiep_stis:
 						if be_tiep_sti.entity_sti_index >= finish_tiep_first_index:
-							matching_entities.append(entity_id)
+							matching_entities.add(entity_id)
 							break
-
-		if pattern_seq_db.support == len(matching_entities):
-			return True
+					if pattern_seq_db.support == len(matching_entities):
+						return True
 
 	return False
 
@@ -84,20 +92,24 @@ def __do_be_be_match_in_all_entities(
 	:return: (bool) whether all entities include an STI which matches the backward-extension tieps
 	"""
 
+	entity_ids: List[str] = pattern_seq_db.get_entity_ids()
+
 	for be_tiep in start_tiep_be_tieps:
-		matching_entities: List[str] = []
+		matching_entities: Set[str] = set()
+
+		be_stis_per_entry: Dict[int, List[STI]] = be_tiep.stis_per_entry
 
 		for db_entry_index, finish_tiep_stis in finish_be_tiep.stis_per_entry.items():
-			if db_entry_index in be_tiep.stis_per_entry:
-				entity_id: str = pattern_seq_db.db[db_entry_index][0].entity
+			be_tiep_stis: Optional[List[STI]] = be_stis_per_entry.get(db_entry_index)
+			if be_tiep_stis is not None:
+				entity_id: str = entity_ids[db_entry_index]
 				if entity_id not in matching_entities:
 					for finish_tiep_sti in finish_tiep_stis:
-						if finish_tiep_sti in be_tiep.stis_per_entry[db_entry_index]:
-							matching_entities.append(entity_id)
+						if finish_tiep_sti in be_tiep_stis:
+							matching_entities.add(entity_id)
 							break
-
-		if pattern_seq_db.support == len(matching_entities):
-			return True
+					if pattern_seq_db.support == len(matching_entities):
+						return True
 
 	return False
 
@@ -105,7 +117,7 @@ def __do_be_be_match_in_all_entities(
 def back_scan(
 		pattern_seq_db: SequenceDB,
 		maximal_gap: int
-) -> Tuple[bool, Dict[str, List[BackwardExtensionTiep]]]:
+) -> Tuple[bool, Dict[int, List[BackwardExtensionTiep]]]:
 	"""
 	checks whether a projected pattern has the potential of being closed or not, based on its backward extension tieps
 	:param pattern_seq_db: (SequenceDB) projected sequence database
@@ -114,50 +126,78 @@ def back_scan(
 		based on its backward extension tieps
 	"""
 
-	be_tieps_lists: Dict[str, List[BackwardExtensionTiep]] = {}
-	for i in range(len(pattern_seq_db.db[0][1].tieps)):
-		cumulative_ith_before_be_tieps: Optional[Dict[str, BackwardExtensionTiep]] = None
-		entity_ith_before_be_tieps: Optional[Dict[str, BackwardExtensionTiep]] = None
+	be_tieps_lists: Dict[int, List[BackwardExtensionTiep]] = {}
+	co_code: int = constants.BE_CO_CODE
+	meet_code: int = constants.BE_MEET_CODE
+	regular_code: int = constants.BE_REGULAR_CODE
+	code_bits: int = constants.BE_CODE_BITS
+	db: List[Tuple[CoincidenceSequence, PatternInstance]] = pattern_seq_db.db
+	add_current_tiep_to_entity_be_tieps = __add_current_tiep_to_entity_be_tieps
+	# entity, tiep instances & next coincidences of every db entry, gathered once for all the scanned tieps
+	entries: List[Tuple[str, List[Tiep], List[Coincidence]]] = [
+		(coincidence_seq.entity, pattern_instance.tieps, pattern_instance.next_coincidences)
+		for coincidence_seq, pattern_instance in db
+	]
+	for i in range(len(db[0][1].tieps)):
+		cumulative_ith_before_be_tieps: Optional[Dict[int, BackwardExtensionTiep]] = None
+		entity_ith_before_be_tieps: Optional[Dict[int, BackwardExtensionTiep]] = None
 		entry_index: int = 0
-		for coincidence_seq, pattern_instance in pattern_seq_db.db:
-
-			if entry_index == 0 or coincidence_seq.entity != pattern_seq_db.db[entry_index - 1][0].entity:
+		last_entity_id: Optional[str] = None
+		# once a previous entity has been scanned, only its backward-extension tieps may survive, hence every
+		# other tiep is skipped upfront
+		for entity_id, tieps, next_coincidences in entries:
+
+			# the entries of every entity are consecutive
+			if entity_id != last_entity_id:
+				last_entity_id = entity_id
 				cumulative_ith_before_be_tieps = entity_ith_before_be_tieps
 				if cumulative_ith_before_be_tieps is not None and len(cumulative_ith_before_be_tieps) == 0:
 					break
 				entity_ith_before_be_tieps = {}
 
-			tiep_instance: Tiep = pattern_instance.tieps[i]
-			current_coincidence: Coincidence = pattern_instance.next_coincidences[i]
+			tiep_instance: Tiep = tieps[i]
+			current_coincidence: Coincidence = next_coincidences[i]
+			tiep_coincidence_index: int = tiep_instance.coincidence.index
+			# index of the coincidence whose tieps meet the tiep instance, if any
+			meet_coincidence_index: int = tiep_coincidence_index - 1 if tiep_instance.coincidence.is_meet else -1
 
-			coincidence_prefix: str = constants.CO_REP if current_coincidence.is_co else \
-				(constants.MEET_REP if current_coincidence.is_meet else '*')
-			while current_coincidence.index != tiep_instance.coincidence.index:
+			coincidence_code: int = co_code if current_coincidence.is_co else \
+				(meet_code if current_coincidence.is_meet else regular_code)
+			while current_coincidence.index != tiep_coincidence_index:
 
-				if current_coincidence.index == tiep_instance.coincidence.index - 1 and tiep_instance.coincidence.is_meet:
+				if current_coincidence.index == meet_coincidence_index:
+					prefix_codes: int = (coincidence_code << code_bits) | meet_code
 					for current_tiep in current_coincidence.tieps:
-						tiep_full_rep: str = coincidence_prefix + constants.MEET_REP + current_tiep.primitive_rep
-						__add_current_tiep_to_entity_be_tieps(
+						tiep_full_rep: int = current_tiep.be_rep_id | prefix_codes
+						if cumulative_ith_before_be_tieps is not None and tiep_full_rep not in cumulative_ith_before_be_tieps:
+							continue
+						add_current_tiep_to_entity_be_tieps(
 							tiep_instance, current_tiep, tiep_full_rep, entry_index,
 							entity_ith_before_be_tieps, cumulative_ith_before_be_tieps, maximal_gap, check_gap=False
 						)
 
 				else:
+					prefix_codes: int = (coincidence_code << code_bits) | regular_code
 					for current_tiep in current_coincidence.tieps:
-						tiep_full_rep: str = coincidence_prefix + '*' + current_tiep.primitive_rep
-						__add_current_tiep_to_entity_be_tieps(
+						tiep_full_rep: int = current_tiep.be_rep_id | prefix_codes
+						if cumulative_ith_before_be_tieps is not None and tiep_full_rep not in cumulative_ith_before_be_tieps:
+							continue
+						add_current_tiep_to_entity_be_tieps(
 							tiep_instance, current_tiep, tiep_full_rep, entry_index,
 							entity_ith_before_be_tieps, cumulative_ith_before_be_tieps, maximal_gap, check_gap=True
 						)
 
-				coincidence_prefix = constants.MEET_REP if current_coincidence.is_co and current_coincidence.next.is_meet else '*'
+				coincidence_code = meet_code if current_coincidence.is_co and current_coincidence.next.is_meet else regular_code
 				current_coincidence = current_coincidence.next
 
+			prefix_codes: int = (coincidence_code << code_bits) | co_code
 			for current_tiep in current_coincidence.tieps:
-				if current_tiep == tiep_instance or tiep_instance == current_tiep.orig_tiep:
+				if current_tiep is tiep_instance or current_tiep.orig_tiep is tiep_instance:
 					break
-				tiep_full_rep: str = coincidence_prefix + constants.CO_REP + current_tiep.primitive_rep
-				__add_current_tiep_to_entity_be_tieps(
+				tiep_full_rep: int = current_tiep.be_rep_id | prefix_codes
+				if cumulative_ith_before_be_tieps is not None and tiep_full_rep not in cumulative_ith_before_be_tieps:
+					continue
+				add_current_tiep_to_entity_be_tieps(
 					tiep_instance, current_tiep, tiep_full_rep, entry_index,
 					entity_ith_before_be_tieps, cumulative_ith_before_be_tieps, maximal_gap, check_gap=False
 				)
@@ -174,37 +214,40 @@ def back_scan(
 
 
 def finalize_ith_before_be_tieps(
-		cumulative_ith_before_be_tieps: Dict[str, BackwardExtensionTiep],
-		be_tieps_lists: Dict[str, List[BackwardExtensionTiep]],
+		cumulative_ith_before_be_tieps: Dict[int, BackwardExtensionTiep],
+		be_tieps_lists: Dict[int, List[BackwardExtensionTiep]],
 		pattern_seq_db: SequenceDB
 ) -> bool:
 	"""
 	checks whether a given projected pattern has the potential of being closed or not, and also returns
 		its final ith-before backward-extension tieps, for some i
-	:param cumulative_ith_before_be_tieps: (Dict[str, BackwardExtensionTiep]) cumulative ith-before backward-extension
+	:param cumulative_ith_before_be_tieps: (Dict[int, BackwardExtensionTiep]) cumulative ith-before backward-extension
 		tieps over all entities
-	:param be_tieps_lists: (Dict[str, List[BackwardExtensionTiep]]) backward-extension tieps
+	:param be_tieps_lists: (Dict[int, List[BackwardExtensionTiep]]) backward-extension start tieps by symbol
 	:param pattern_seq_db: (SequenceDB) projected sequence database
 	:return: (bool) whether a given projected pattern
 		has the potential of being closed or not based on the ith-before backward-extension tieps
 	"""
 
-	for be_tiep_full_rep, be_tiep in cumulative_ith_before_be_tieps.items():
-		be_tiep_primitive_rep: str = be_tiep_full_rep[2:]
-
-		if be_tiep_primitive_rep[-1] == constants.START_REP:
-			if be_tiep_primitive_rep not in be_tieps_lists:
-				be_tieps_lists[be_tiep_primitive_rep] = []
-			be_tieps_lists[be_tiep_primitive_rep].append(be_tiep)
+	# the finish tieps are matched only once all the start tieps have been collected
+	finish_be_tieps: List[Tuple[int, BackwardExtensionTiep]] = []
 
 	for be_tiep_full_rep, be_tiep in cumulative_ith_before_be_tieps.items():
-		be_tiep_primitive_rep: str = be_tiep_full_rep[2:]
+		be_tiep_id: int = be_tiep_full_rep >> constants.BE_PREFIX_BITS
+		symbol: int = be_tiep_id >> 1
+
+		# a start tiep is keyed by its symbol, while a finish tiep is matched against the start tieps of its symbol
+		if be_tiep_id & 1:
+			finish_be_tieps.append((symbol, be_tiep))
+		elif symbol not in be_tieps_lists:
+			be_tieps_lists[symbol] = [be_tiep]
+		else:
+			be_tieps_lists[symbol].append(be_tiep)
 
-		if be_tiep_primitive_rep[-1] == constants.FINISH_REP:
-			be_tiep_primitive_rep = be_tiep_primitive_rep.replace(constants.FINISH_REP, constants.START_REP)
-			if be_tiep_primitive_rep in be_tieps_lists and \
-				__do_be_be_match_in_all_entities(be_tieps_lists[be_tiep_primitive_rep], be_tiep, pattern_seq_db):
-				return False
+	for symbol, be_tiep in finish_be_tieps:
+		if symbol in be_tieps_lists and \
+			__do_be_be_match_in_all_entities(be_tieps_lists[symbol], be_tiep, pattern_seq_db):
+			return False
 
 	return True
 
@@ -213,8 +256,8 @@ def collect_be_tieps_wrt_tiep_instance(
 		tiep_instance: Tiep,
 		current_coincidence: Coincidence,
 		entry_index: int,
-		entity_be_tieps: Dict[str, BackwardExtensionTiep],
-		cumulative_be_tieps: Optional[Dict[str, BackwardExtensionTiep]],
+		entity_be_tieps: Dict[int, BackwardExtensionTiep],
+		cumulative_be_tieps: Optional[Dict[int, BackwardExtensionTiep]],
 		maximal_gap: int
 ) -> None:
 	"""
@@ -222,32 +265,39 @@ def collect_be_tieps_wrt_tiep_instance(
 	:param tiep_instance: (Tiep) tiep instance w.r.t which sequence database has been projected
 	:param current_coincidence: (Coincidence) coincidence from which to look for backward-extension tieps
 	:param entry_index: (int) index of entry in projected sequence database
-	:param entity_be_tieps: (Dict[str, BackwardExtensionTiep]) entity backward-extension tieps
-	:param cumulative_be_tieps: (Optional[Dict[str, BackwardExtensionTiep]]) cumulative backward-extension
+	:param entity_be_tieps: (Dict[int, BackwardExtensionTiep]) entity backward-extension tieps
+	:param cumulative_be_tieps: (Optional[Dict[int, BackwardExtensionTiep]]) cumulative backward-extension
 		tieps over all entities
 	:param maximal_gap: (int) maximal gap
 	:return: (None)
 	"""
 
+	# the maximal gap holds for an STI w.r.t the tiep instance only if it finishes after this bound
+	gap_lower_bound: int = tiep_instance.sti.start_time - maximal_gap
+
 	for tiep_rep, be_tiep in entity_be_tieps.items():
-		if tiep_rep[0] != constants.CO_REP and tiep_rep[0] != constants.MEET_REP:
+		if tiep_rep & constants.BE_CODE_MASK == constants.BE_REGULAR_CODE:
 			if entry_index - 1 not in be_tiep.stis_per_entry:
 				continue
 			for sti in be_tiep.stis_per_entry[entry_index - 1]:
-				if utils.max_gap_holds(sti.finish_time, tiep_instance, maximal_gap):
+				if sti.finish_time > gap_lower_bound:
 					entity_be_tieps[tiep_rep].add_sti_in_entry(entry_index, sti)
 
-	while current_coincidence.index != tiep_instance.coincidence.index:
-		if current_coincidence.index == tiep_instance.coincidence.index - 1 and tiep_instance.coincidence.is_meet:
+	tiep_coincidence_index: int = tiep_instance.coincidence.index
+	# index of the coincidence whose tieps meet the tiep instance, if any
+	meet_coincidence_index: int = tiep_coincidence_index - 1 if tiep_instance.coincidence.is_meet else -1
+
+	while current_coincidence.index != tiep_coincidence_index:
+		if current_coincidence.index == meet_coincidence_index:
 			for current_tiep in current_coincidence.tieps:
-				tiep_full_rep: str = constants.MEET_REP + current_tiep.primitive_rep
+				tiep_full_rep: int = current_tiep.be_rep_id | constants.BE_MEET_CODE
 				__add_current_tiep_to_entity_be_tieps(
 					tiep_instance, current_tiep, tiep_full_rep, entry_index,
 					entity_be_tieps, cumulative_be_tieps, maximal_gap, check_gap=False
 				)
 		else:
 			for current_tiep in current_coincidence.tieps:
-				tiep_full_rep: str = '*' + current_tiep.primitive_rep
+				tiep_full_rep: int = current_tiep.be_rep_id | constants.BE_REGULAR_CODE
 				__add_current_tiep_to_entity_be_tieps(
 					tiep_instance, current_tiep, tiep_full_rep, entry_index,
 					entity_be_tieps, cumulative_be_tieps, maximal_gap, check_gap=True
@@ -255,9 +305,9 @@ def collect_be_tieps_wrt_tiep_instance(
 		current_coincidence = current_coincidence.next
 
 	for current_tiep in current_coincidence.tieps:
-		if current_tiep == tiep_instance:
+		if current_tiep is tiep_instance:
 			break
-		tiep_full_rep: str = constants.CO_REP + current_tiep.primitive_rep
+		tiep_full_rep: int = current_tiep.be_rep_id | constants.BE_CO_CODE
 		__add_current_tiep_to_entity_be_tieps(
 			tiep_instance, current_tiep, tiep_full_rep, entry_index,
 			entity_be_tieps, cumulative_be_tieps, maximal_gap, check_gap=False
@@ -267,10 +317,10 @@ def collect_be_tieps_wrt_tiep_instance(
 def __add_current_tiep_to_entity_be_tieps(
 		projected_tiep_instance: Tiep,
 		current_tiep: Tiep,
-		tiep_full_rep: str,
+		tiep_full_rep: int,
 		entry_index: int,
-		entity_be_tieps: Dict[str, BackwardExtensionTiep],
-		cumulative_be_tieps: Optional[Dict[str, BackwardExtensionTiep]],
+		entity_be_tieps: Dict[int, BackwardExtensionTiep],
+		cumulative_be_tieps: Optional[Dict[int, BackwardExtensionTiep]],
 		maximal_gap: int,
 		check_gap: bool
 ) -> None:
@@ -278,47 +328,54 @@ def __add_current_tiep_to_entity_be_tieps(
 	adds a current tiep as a backward-extension tiep w.r.t the projected tiep instance, if necessary
 	:param projected_tiep_instance: (Tiep) tiep instance w.r.t which sequence database has been projected
 	:param current_tiep: (Tiep) tiep to add to a backward-extension tiep
-	:param tiep_full_rep: (str) tiep string representation
+	:param tiep_full_rep: (int) tiep backward-extension representation
 	:param entry_index: (int) index of entry in projected sequence database
-	:param entity_be_tieps: (Dict[str, BackwardExtensionTiep]) entity backward-extension tieps
-	:param cumulative_be_tieps: (Optional[Dict[str, BackwardExtensionTiep]]) cumulative backward-extension
+	:param entity_be_tieps: (Dict[int, BackwardExtensionTiep]) entity backward-extension tieps
+	:param cumulative_be_tieps: (Optional[Dict[int, BackwardExtensionTiep]]) cumulative backward-extension
 		tieps over all entities
 	:param maximal_gap: (int) maximal gap
 	:param check_gap: (bool) whether maximal gap has to be tested or not
 	:return: (None)
 	"""
 
-	if (cumulative_be_tieps is None or tiep_full_rep in cumulative_be_tieps) and \
-		(not check_gap or utils.max_gap_holds(current_tiep.sti.finish_time, projected_tiep_instance, maximal_gap)):
-		if tiep_full_rep not in entity_be_tieps:
-			if cumulative_be_tieps is None:
-				entity_be_tieps[tiep_full_rep] = BackwardExtensionTiep()
-			else:
-				entity_be_tieps[tiep_full_rep] = cumulative_be_tieps[tiep_full_rep]
-		entity_be_tieps[tiep_full_rep].add_sti_in_entry(entry_index, current_tiep.sti)
+	if check_gap and current_tiep.sti.finish_time <= projected_tiep_instance.sti.start_time - maximal_gap:
+		return
+
+	be_tiep: Optional[BackwardExtensionTiep] = entity_be_tieps.get(tiep_full_rep)
+	if be_tiep is None:
+		if cumulative_be_tieps is None:
+			be_tiep = BackwardExtensionTiep()
+		else:
+			be_tiep = cumulative_be_tieps.get(tiep_full_rep)
+			if be_tiep is None:
+				return
+		entity_be_tieps[tiep_full_rep] = be_tiep
+	be_tiep.add_sti_in_entry(entry_index, current_tiep.sti)
 
 
 def finalize_initial_be_tieps(
-		cumulative_be_tieps: Dict[str, BackwardExtensionTiep]
-) -> Tuple[bool, Dict[str, List[BackwardExtensionTiep]]]:
+		cumulative_be_tieps: Dict[int, BackwardExtensionTiep]
+) -> Tuple[bool, Dict[int, List[BackwardExtensionTiep]]]:
 	"""
 	checks whether a given initial (one-tiep) pattern has the potential of being closed or not, and also returns
 		its final backward-extension tieps
-	:param cumulative_be_tieps: (Dict[str, BackwardExtensionTiep]) cumulative backward-extension
+	:param cumulative_be_tieps: (Dict[int, BackwardExtensionTiep]) cumulative backward-extension
 		tieps over all entities
-	:return: (Tuple[bool, Dict[str, List[BackwardExtensionTiep]]]) whether a given initial (one-tiep) pattern
+	:return: (Tuple[bool, Dict[int, List[BackwardExtensionTiep]]]) whether a given initial (one-tiep) pattern
 		has the potential of being closed or not, and its final backward-extension tieps
 	"""
 
-	be_tieps_lists: Dict[str, List[BackwardExtensionTiep]] = {}
+	be_tieps_lists: Dict[int, List[BackwardExtensionTiep]] = {}
 
 	for be_tiep_full_rep, be_tiep in cumulative_be_tieps.items():
-		be_tiep_primitive_rep: str = be_tiep_full_rep[1:]
-
-		if be_tiep_primitive_rep[-1] == constants.START_REP:
-			if be_tiep_primitive_rep not in be_tieps_lists:
-				be_tieps_lists[be_tiep_primitive_rep] = []
-			be_tieps_lists[be_tiep_primitive_rep].append(be_tiep)
+		be_tiep_id: int = be_tiep_full_rep >> constants.BE_PREFIX_BITS
+
+		# a start tiep, keyed by its symbol
+		if not be_tiep_id & 1:
+			symbol: int = be_tiep_id >> 1
+			if symbol not in be_tieps_lists:
+				be_tieps_lists[symbol] = []
+			be_tieps_lists[symbol].append(be_tiep)
 
 		else:
 			return False, be_tieps_lists
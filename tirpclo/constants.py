@@ -6,6 +6,14 @@ FINISH_REP = '-'  # finishing tiep representation
 MEET_REP = '@'  # meet representation
 CO_REP = '_'  # co-occurrence representation
 
+# backward-extension tiep representation: the id of a tiep (by symbol & type) followed by two prefix codes
+BE_CO_CODE = 0  # co-occurrence prefix code
+BE_MEET_CODE = 1  # meet prefix code
+BE_REGULAR_CODE = 2  # regular (neither co-occurrence nor meet) prefix code
+BE_CODE_BITS = 2  # bits of a prefix code
+BE_CODE_MASK = 3  # mask of a prefix code
+BE_PREFIX_BITS = 4  # bits of both prefix codes
+
 # input & output files
 FILE_START = 'startToncepts'
 FILE_NUM = 'numberOfEntities'
@@ -1,14 +1,16 @@
-from typing import List, Optional, Dict, Tuple
+from typing import List, Optional, Dict, Tuple, Set, FrozenSet, Sequence, Iterable, Iterator
 from dataclasses import dataclass, field
+import heapq
+from itertools import chain, islice
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from tiep_index import TiepIndex
 from tirpclo import constants
 
 
-@dataclass(order=True)
 class STI:
-    """this class represents an STI, i.e., Symbolic Time Interval
+    """this class represents an STI, i.e., Symbolic Time Interval; every STI object stands for a distinct
+        interval of the input, hence STIs are compared by identity
 
     Attributes:  # noqa
         start_time: (int) start-time
@@ -16,17 +18,24 @@ class STI:
         symbol: (int) symbol
         entity_sti_index: (int) index of STI within ordered list of STIs having the same symbol
             in the respective entity
+        text_rep: (Optional[str]) text representation of the STI, as written within every TIRP instance it is part of;
+            built upon first use
     """
-    start_time: int
-    finish_time: int
-    symbol: int
-    entity_sti_index: int = -1
+    __slots__ = ('start_time', 'finish_time', 'symbol', 'entity_sti_index', 'text_rep')
+
+    def __init__(self, start_time: int, finish_time: int, symbol: int, entity_sti_index: int = -1):
+        self.start_time: int = start_time
+        self.finish_time: int = finish_time
+        self.symbol: int = symbol
+        self.entity_sti_index: int = entity_sti_index
+        self.text_rep: Optional[str] = None
 
     def __repr__(self):
-        return f"[{self.start_time}-{self.finish_time}]"
+        if self.text_rep is None:
+            self.text_rep = f"[{self.start_time}-{self.finish_time}]"
+        return self.text_rep
 
 
-@dataclass
 class Tiep:
     """this class represents a Tiep, i.e., Time Interval End-Point
 
@@ -37,26 +46,81 @@ class Tiep:
         coincidence: (Coincidence) coincidence to which the tiep belongs
         type: (str) type of tiep
         primitive_rep: (str) tiep primitive representation, e.g., A+ or B-
+        co_rep: (str) tiep co-occurrence representation, e.g., _A+
+        meet_rep: (str) tiep meet representation, e.g., @A+
+        be_rep_id: (int) id of the tiep within backward-extension tiep representations, i.e., its symbol & type,
+            shifted to leave room for the prefix codes
+        primitive_rep_id: (int) dense id of the tiep primitive representation, assigned by the tiep index
+        co_rep_id: (int) dense id of the tiep co-occurrence representation, assigned by the tiep index
+        meet_rep_id: (int) dense id of the tiep meet representation, assigned by the tiep index
         orig_tiep: (Optional[Tiep]) original tiep object from which current tiep is derived
             (relevant for meet / co-occurrence tieps only)
         entity_tiep_index: (int) index of tiep within ordered list of tieps having the same primitive_rep
             in the respective entity
     """
-    symbol: int = field(init=False)
-    time: int
-    sti: STI
-    coincidence: 'Coincidence'
-    type: str
-    primitive_rep: str = field(init=False)
-    orig_tiep: Optional['Tiep'] = None
-    entity_tiep_index: int = -1
+    __slots__ = (
+        'symbol', 'time', 'sti', 'coincidence', 'type', 'primitive_rep', 'co_rep', 'meet_rep', 'be_rep_id',
+        'primitive_rep_id', 'co_rep_id', 'meet_rep_id', 'orig_tiep', 'entity_tiep_index'
+    )
+
+    def __init__(
+            self,
+            time: int,
+            sti: STI,
+            coincidence: 'Coincidence',
+            type: str,
+            orig_tiep: Optional['Tiep'] = None,
+            entity_tiep_index: int = -1
+    ):
+        self.symbol: int = sti.symbol
+        self.time: int = time
+        self.sti: STI = sti
+        self.coincidence: 'Coincidence' = coincidence
+        self.type: str = type
+        self.primitive_rep: str = f'{self.symbol}{self.type}'
+        self.co_rep: str = constants.CO_REP + self.primitive_rep
+        self.meet_rep: str = constants.MEET_REP + self.primitive_rep
+        self.be_rep_id: int = ((self.symbol << 1) | (self.type == constants.FINISH_REP)) << constants.BE_PREFIX_BITS
+        self.primitive_rep_id: int = -1
+        self.co_rep_id: int = -1
+        self.meet_rep_id: int = -1
+        self.orig_tiep: Optional[Tiep] = orig_tiep
+        self.entity_tiep_index: int = entity_tiep_index
 
-    def __post_init__(self):
-        self.symbol = self.sti.symbol
-        self.primitive_rep = f'{self.symbol}{self.type}'
+    def __repr__(self):
+        return f"{self.primitive_rep}{self.sti!r}"
+
+
+class TiepView:
+    """this class represents a Tiep View, i.e., a lightweight tiep derived from an original tiep
+        (relevant for co-occurrence tieps of partially projected coincidences only), sharing all of its fields
+        except for the original tiep
+
+    Attributes:  # noqa
+        see Tiep
+    """
+    __slots__ = (
+        'symbol', 'time', 'sti', 'coincidence', 'type', 'primitive_rep', 'co_rep', 'meet_rep', 'be_rep_id',
+        'primitive_rep_id', 'co_rep_id', 'meet_rep_id', 'orig_tiep', 'entity_tiep_index'
+    )
+
+    def __init__(self, src: Tiep, orig_tiep: Tiep):
+        self.symbol: int = src.symbol
+        self.time: int = src.time
+        self.sti: STI = src.sti
+        self.coincidence: 'Coincidence' = src.coincidence
+        self.type: str = src.type
+        self.primitive_rep: str = src.primitive_rep
+        self.co_rep: str = src.co_rep
+        self.meet_rep: str = src.meet_rep
+        self.be_rep_id: int = src.be_rep_id
+        self.primitive_rep_id: int = src.primitive_rep_id
+        self.co_rep_id: int = src.co_rep_id
+        self.meet_rep_id: int = src.meet_rep_id
+        self.orig_tiep: Tiep = orig_tiep
+        self.entity_tiep_index: int = src.entity_tiep_index
 
 
-@dataclass
 class Coincidence:
     """this class represents a Coincidence, i.e., list of coinciding tieps within a sequence
 
@@ -65,17 +129,51 @@ class Coincidence:
         is_meet: (bool) whether it is a 'meet' coincidence
             (i.e., includes start tieps co-occurring with other finish tieps)
         is_co: (bool) whether it is a 'co-occurrence' coincidence (relevant for partially projected coincidences only)
-        tieps: (List[tiep]) list of coinciding tieps
+        tieps: (Sequence[Tiep]) sequence of coinciding tieps (a list while the coincidence is built,
+            frozen into a tuple once the initial sequence database is filtered)
         next: (Optional[Coincidence]) next coincidence in sequence
+        co_tieps_suffixes: (Optional[Dict[int, Sequence[Tiep]]]) cached co-occurrence tieps following each position
+            within the coincidence, built upon first projection from that position
     """
-    index: int
-    is_meet: bool = False
-    is_co: bool = False
-    tieps: List[Tiep] = field(default_factory=lambda: [])
-    next: Optional['Coincidence'] = None
+    __slots__ = ('index', 'is_meet', 'is_co', 'tieps', 'next', 'co_tieps_suffixes')
+
+    def __init__(
+            self,
+            index: int,
+            is_meet: bool = False,
+            is_co: bool = False,
+            tieps: Optional[Sequence[Tiep]] = None,
+            next: Optional['Coincidence'] = None
+    ):
+        self.index: int = index
+        self.is_meet: bool = is_meet
+        self.is_co: bool = is_co
+        self.tieps: Sequence[Tiep] = [] if tieps is None else tieps
+        self.next: Optional[Coincidence] = next
+        self.co_tieps_suffixes: Optional[Dict[int, Sequence[Tiep]]] = None
+
+    def get_co_tieps_after(self, position: int) -> Sequence[Tiep]:
+        """
+        returns the co-occurrence tieps that follow a given position within the coincidence, i.e., the tieps
+            of the partially projected coincidence obtained by a projection by the tiep in that position
+        :param position: (int) position of the projected tiep within the coincidence
+        :return: (Sequence[Tiep]) co-occurrence tieps following the position
+        """
+
+        if self.co_tieps_suffixes is None:
+            self.co_tieps_suffixes = {}
+        elif position in self.co_tieps_suffixes:
+            return self.co_tieps_suffixes[position]
+
+        if self.is_co:
+            co_tieps: Sequence[Tiep] = self.tieps[position + 1:]
+        else:
+            co_tieps: Sequence[Tiep] = tuple(TiepView(tiep, tiep) for tiep in self.tieps[position + 1:])
+
+        self.co_tieps_suffixes[position] = co_tieps
+        return co_tieps
 
 
-@dataclass
 class CoincidenceSequence:
     """this class represents a Coincidence Sequence, i.e., ordered list of coincidence objects representing an entity
 
@@ -84,13 +182,51 @@ class CoincidenceSequence:
         first_co: (Coincidence) first coincidence of sequence.
         partial_co: (Optional[Coincidence]) partially projected coincidence with which sequence currently begins,
             if exists
+        coincidences: (Optional[List[Coincidence]]) all coincidences of the entity ordered by index (relevant for
+            initial sequences and sequences projected from them only)
     """
-    entity: str
-    first_co: Coincidence
-    partial_co: Optional[Coincidence] = None
+    __slots__ = ('entity', 'first_co', 'partial_co', 'coincidences')
+
+    def __init__(
+            self,
+            entity: str,
+            first_co: Coincidence,
+            partial_co: Optional[Coincidence] = None,
+            coincidences: Optional[List[Coincidence]] = None
+    ):
+        self.entity: str = entity
+        self.first_co: Coincidence = first_co
+        self.partial_co: Optional[Coincidence] = partial_co
+        self.coincidences: Optional[List[Coincidence]] = coincidences
+
+    def get_coincidences(self) -> Iterable[Coincidence]:
+        """
+        returns the coincidences of the sequence in order; if the flat coincidence list of the entity is available,
+            the coincidences following the first one are scanned out of it by index rather than by following
+            the linked list
+        :return: (Iterable[Coincidence]) coincidences of the sequence
+        """
+
+        if self.first_co is None:
+            return ()
+        if self.coincidences is None:
+            return self.__walk_coincidences()
+        if self.first_co.is_co:
+            return chain((self.first_co,), islice(self.coincidences, self.first_co.index + 1, None))
+        return islice(self.coincidences, self.first_co.index, None)
+
+    def __walk_coincidences(self) -> Iterator[Coincidence]:
+        """
+        walks along the linked list of coincidences of the sequence
+        :return: (Iterator[Coincidence]) coincidences of the sequence
+        """
+
+        current_coincidence: Optional[Coincidence] = self.first_co
+        while current_coincidence is not None:
+            yield current_coincidence
+            current_coincidence = current_coincidence.next
 
 
-@dataclass
 class PatternInstance:
     """this class represents a Pattern Instance, i.e., a specific instance of a specific pattern (TIRP)
 
@@ -99,39 +235,48 @@ class PatternInstance:
         next_coincidences: (List[Coincidence]) list of pointers to coincidences appearing right after projection by the tieps
         symbol_db_indices: (Dict[int, int]) index of latest entity occurrence of each symbol of the pattern instance
         minimal_finish_time: (float) minimal finish time of an STI within the pattern instance
-        pre_matched: (List[STI]) list of STI for which only the start tieps are included within the pattern instances
+        pre_matched: (Dict[int, STI]) STIs for which only the start tieps are included within the pattern instance,
+            keyed by STI identity
         first_expected_finish_time: (float) earliest finish time expected to match the current STIs of the
             pattern instance
+        pre_matched_finish_times: (List[Tuple[int, int]]) lazy min-heap of <finish time, STI key> pairs of
+            pre-matched STIs, from which already matched STIs are discarded only once reaching the top
+        is_complete: (bool) whether no STI is pre-matched, i.e., the pattern instance does not include start tieps
+            without their complementing finish tieps, and thus represents a TIRP instance
     """
-    tieps: List[Tiep] = field(default_factory=lambda: [])
-    next_coincidences: List[Coincidence] = field(default_factory=lambda: [])
-    symbol_db_indices: Dict[int, int] = field(default_factory=lambda: {})
-    minimal_finish_time: float = float('inf')
-    pre_matched: List[STI] = field(default_factory=lambda: [])
-    first_expected_finish_time: float = float('inf')
-
-    def pre_extend_copy(self, current_pattern_instance: 'PatternInstance', is_closed_tirp_mining: bool) -> None:
+    __slots__ = (
+        'tieps', 'next_coincidences', 'symbol_db_indices', 'minimal_finish_time', 'pre_matched',
+        'first_expected_finish_time', 'pre_matched_finish_times', 'is_complete'
+    )
+
+    def __init__(self):
+        self.tieps: List[Tiep] = []
+        self.next_coincidences: List[Coincidence] = []
+        self.symbol_db_indices: Dict[int, int] = {}
+        self.minimal_finish_time: float = float('inf')
+        self.pre_matched: Dict[int, STI] = {}
+        self.first_expected_finish_time: float = float('inf')
+        self.pre_matched_finish_times: List[Tuple[int, int]] = []
+        self.is_complete: bool = True
+
+    def copy_for_extension(self, is_closed_tirp_mining: bool) -> 'PatternInstance':
         """
-        copies (deep) contents of input pattern instance prior to extension
-        :param current_pattern_instance: (PatternInstance) input pattern instance to duplicate
+        returns a (deep) copy of the pattern instance prior to its extension, without constructing default contents
+            which would be immediately replaced
         :param is_closed_tirp_mining: (bool) whether mining only closed TIRPs or not
-        :return: (None)
+        :return: (PatternInstance) duplicated pattern instance
         """
 
-        for t in current_pattern_instance.tieps:
-            self.tieps.append(t)
-
-        if is_closed_tirp_mining:
-            for c in current_pattern_instance.next_coincidences:
-                self.next_coincidences.append(c)
-
-        self.symbol_db_indices = dict(current_pattern_instance.symbol_db_indices)
-        self.minimal_finish_time = current_pattern_instance.minimal_finish_time
-
-        for sti in current_pattern_instance.pre_matched:
-            self.pre_matched.append(sti)
-
-        self.first_expected_finish_time = current_pattern_instance.first_expected_finish_time
+        pattern_instance: PatternInstance = PatternInstance.__new__(PatternInstance)
+        pattern_instance.tieps = self.tieps.copy()
+        pattern_instance.next_coincidences = self.next_coincidences.copy() if is_closed_tirp_mining else []
+        pattern_instance.symbol_db_indices = self.symbol_db_indices.copy()
+        pattern_instance.minimal_finish_time = self.minimal_finish_time
+        pattern_instance.pre_matched = self.pre_matched.copy()
+        pattern_instance.first_expected_finish_time = self.first_expected_finish_time
+        pattern_instance.pre_matched_finish_times = self.pre_matched_finish_times.copy()
+        pattern_instance.is_complete = self.is_complete
+        return pattern_instance
 
     def extend_pattern_instance(self, new_tiep: Tiep, next_coincidence: Coincidence, is_closed_tirp_mining: bool) -> None:
         """
@@ -146,16 +291,23 @@ class PatternInstance:
         if is_closed_tirp_mining:
             self.next_coincidences.append(next_coincidence)
 
-        if new_tiep.sti in self.pre_matched:
-            self.pre_matched.remove(new_tiep.sti)
-            if len(self.pre_matched) == 0:
+        sti_key: int = id(new_tiep.sti)
+        if sti_key in self.pre_matched:
+            del self.pre_matched[sti_key]
+            finish_times: List[Tuple[int, int]] = self.pre_matched_finish_times
+            while len(finish_times) > 0 and finish_times[0][1] not in self.pre_matched:
+                heapq.heappop(finish_times)
+            if len(finish_times) == 0:
                 self.first_expected_finish_time = float('inf')
+                self.is_complete = True
             else:
-                self.first_expected_finish_time = min([sti.finish_time for sti in self.pre_matched])
+                self.first_expected_finish_time = finish_times[0][0]
 
         else:
             self.symbol_db_indices[new_tiep.symbol] = new_tiep.entity_tiep_index
-            self.pre_matched.append(new_tiep.sti)
+            self.pre_matched[sti_key] = new_tiep.sti
+            heapq.heappush(self.pre_matched_finish_times, (new_tiep.sti.finish_time, sti_key))
+            self.is_complete = False
             self.first_expected_finish_time = min(self.first_expected_finish_time, new_tiep.sti.finish_time)
 
         if new_tiep.type == constants.START_REP:
@@ -172,11 +324,90 @@ class SequenceDB:
         entries_prev_indices: (Optional[List[int]]) indices of db entries within previous sequence database,
             from which the current sequence database has been projected
         support: (int) vertical support of pattern represented by this sequence database
+        pre_matched: (Optional[FrozenSet[str]]) primitive representations of the finish tieps whose start tieps
+            are included within the pattern yet they are not (None unless mining closed TIRPs)
+        first_non_co_indices: (Optional[List[int]]) index of the first coincidence of each db entry which is not
+            a partially projected co-occurrence one, or -1 if none exists; built upon first use
+        first_regular_co_indices: (Optional[List[int]]) index of the first regular (i.e., neither co-occurrence
+            nor meet) coincidence of each db entry, or -1 if none exists; built upon first use
+        entries_by_prev_index: (Optional[Dict[int, List[int]]]) indices of db entries projected from each entry
+            of the previous sequence database; built upon first use
+        entity_ids: (Optional[List[str]]) entity of each db entry; built upon first use
     """
     db: List[Tuple[CoincidenceSequence, PatternInstance]]
     entries_prev_indices: Optional[List[int]]
     support: int
-    pre_matched: Optional[List[str]]
+    pre_matched: Optional[FrozenSet[str]]
+    first_non_co_indices: Optional[List[int]] = field(default=None, repr=False)
+    first_regular_co_indices: Optional[List[int]] = field(default=None, repr=False)
+    entries_by_prev_index: Optional[Dict[int, List[int]]] = field(default=None, repr=False)
+    entity_ids: Optional[List[str]] = field(default=None, repr=False)
+
+    def get_first_non_co_indices(self) -> List[int]:
+        """
+        returns the index of the first coincidence of each db entry, skipping a leading partially projected
+            co-occurrence coincidence
+        :return: (List[int]) index of the first non co-occurrence coincidence of each db entry, or -1 if none exists
+        """
+
+        if self.first_non_co_indices is None:
+            self.__index_first_coincidences()
+        return self.first_non_co_indices
+
+    def get_first_regular_co_indices(self) -> List[int]:
+        """
+        returns the index of the first regular coincidence of each db entry, skipping a leading partially projected
+            co-occurrence coincidence and a following meet coincidence
+        :return: (List[int]) index of the first regular coincidence of each db entry, or -1 if none exists
+        """
+
+        if self.first_regular_co_indices is None:
+            self.__index_first_coincidences()
+        return self.first_regular_co_indices
+
+    def __index_first_coincidences(self) -> None:
+        """
+        builds the indices of the first non co-occurrence and first regular coincidences of all db entries
+            in a single pass
+        :return: (None)
+        """
+
+        self.first_non_co_indices = []
+        self.first_regular_co_indices = []
+        for coincidence_seq, _ in self.db:
+            current_coincidence: Optional[Coincidence] = coincidence_seq.first_co
+            if current_coincidence is not None and current_coincidence.is_co:
+                current_coincidence = current_coincidence.next
+            self.first_non_co_indices.append(-1 if current_coincidence is None else current_coincidence.index)
+            if current_coincidence is not None and current_coincidence.is_meet:
+                current_coincidence = current_coincidence.next
+            self.first_regular_co_indices.append(-1 if current_coincidence is None else current_coincidence.index)
+
+    def get_entries_by_prev_index(self) -> Dict[int, List[int]]:
+        """
+        returns the indices of the db entries projected from each entry of the previous sequence database
+        :return: (Dict[int, List[int]]) ascending indices of db entries by index of entry within previous
+            sequence database
+        """
+
+        if self.entries_by_prev_index is None:
+            self.entries_by_prev_index = {}
+            for entry_index, prev_entry_index in enumerate(self.entries_prev_indices):
+                if prev_entry_index not in self.entries_by_prev_index:
+                    self.entries_by_prev_index[prev_entry_index] = []
+                self.entries_by_prev_index[prev_entry_index].append(entry_index)
+
+        return self.entries_by_prev_index
+
+    def get_entity_ids(self) -> List[str]:
+        """
+        returns the entity of each db entry
+        :return: (List[str]) entity ID of each db entry
+        """
+
+        if self.entity_ids is None:
+            self.entity_ids = [coincidence_seq.entity for coincidence_seq, _ in self.db]
+        return self.entity_ids
 
     def filter_infrequent_tieps_from_initial_seq_db(self, index: 'TiepIndex') -> None:
         """
@@ -184,40 +415,52 @@ class SequenceDB:
         :param index: (TiepIndex) main tiep index
         :return: (None)
         """
+        master_tiep_ids: Set[int] = index.get_master_tiep_ids()
+
         for coincidence_seq, _ in self.db:
-            current_coincidence: Coincidence = coincidence_seq.first_co
+            current_coincidence: Optional[Coincidence] = coincidence_seq.first_co
             previous_coincidence: Optional[Coincidence] = None
-            removed_coincidences: int = 0
+            coincidence_seq.coincidences = []
+            new_co_index: int = 0
             removed_recent: bool = False
 
+            # single pass over the sequence, relinking surviving coincidences and re-indexing them densely
             while current_coincidence is not None:
                 tieps: List[Tiep] = current_coincidence.tieps
-                removed_co_tieps: int = 0
-                running_index: int = 0
 
-                while running_index < len(tieps) + removed_co_tieps:
-                    if tieps[running_index - removed_co_tieps].primitive_rep not in index.master_tieps:
-                        tieps.remove(tieps[running_index - removed_co_tieps])
-                        removed_co_tieps += 1
-                    running_index += 1
+                # in-place compaction of the frequent tieps
+                write_index: int = 0
+                for read_index in range(len(tieps)):
+                    if tieps[read_index].primitive_rep_id in master_tiep_ids:
+                        tieps[write_index] = tieps[read_index]
+                        write_index += 1
+                del tieps[write_index:]
 
-                if len(tieps) == 0:
-                    removed_coincidences += 1
+                if write_index == 0:
                     removed_recent = True
-                    if previous_coincidence is not None:
-                        previous_coincidence.next = current_coincidence.next
 
                 else:
-                    current_coincidence.index -= removed_coincidences
+                    # the tieps of the initial sequence database are read-only from here on
+                    current_coincidence.tieps = tuple(tieps)
+                    current_coincidence.index = new_co_index
+                    new_co_index += 1
+                    coincidence_seq.coincidences.append(current_coincidence)
                     if removed_recent:
                         current_coincidence.is_meet = False
                     if previous_coincidence is None:
                         coincidence_seq.first_co = current_coincidence
+                    else:
+                        previous_coincidence.next = current_coincidence
                     removed_recent = False
                     previous_coincidence = current_coincidence
 
                 current_coincidence = current_coincidence.next
 
+            if previous_coincidence is None:
+                coincidence_seq.first_co = None
+            else:
+                previous_coincidence.next = None
+
 
 @dataclass
 class TiepProjector:
@@ -225,15 +468,14 @@ class TiepProjector:
         a given sequence database
 
     Attributes:  # noqa
-        supporting_entities: (List[str]) list of supporting entities of the tiep-projector's tiep
-        first_indices: (Dict[int, int]) first index of the tiep-projector's tiep within each record
-            of a sequence database
+        supporting_entities: (Set[str]) set of supporting entities of the tiep-projector's tiep
+        first_indices: (Dict[int, int]) first index of the tiep-projector's tiep within each supporting record
+            of a sequence database, in the order by which the records have been recorded
     """
-    supporting_entities: List[str] = field(default_factory=lambda: [])
-    first_indices: Dict[int, int] = field(default_factory=lambda: {})
+    supporting_entities: Set[str] = field(default_factory=set)
+    first_indices: Dict[int, int] = field(default_factory=dict)
 
 
-@dataclass
 class BackwardExtensionTiep:
     """this class represents a 'Backward-Extension' Tiep, i.e., a data structure which models
         the per-record STIs of a backward-extension tiep from some i-th before/co period of time
@@ -242,9 +484,14 @@ class BackwardExtensionTiep:
     Attributes:  # noqa
         stis_per_entry: (Dict[int, List[STI]]) list of STIs per entry of a sequence database
     """
-    stis_per_entry: Dict[int, List[STI]] = field(default_factory=lambda: {})
+    __slots__ = ('stis_per_entry',)
+
+    def __init__(self):
+        self.stis_per_entry: Dict[int, List[STI]] = {}
 
     def add_sti_in_entry(self, entry_index: int, sti: STI) -> None:
-        if entry_index not in self.stis_per_entry:
-            self.stis_per_entry[entry_index] = []
-        self.stis_per_entry[entry_index].append(sti)
+        entry_stis: Optional[List[STI]] = self.stis_per_entry.get(entry_index)
+        if entry_stis is None:
+            self.stis_per_entry[entry_index] = [sti]
+        else:
+            entry_stis.append(sti)
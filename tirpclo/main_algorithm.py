@@ -1,6 +1,10 @@
-from typing import List, Dict, Optional, Tuple
-from typing.io import TextIO
-from tirpclo.data_types import SequenceDB, TiepProjector, CoincidenceSequence, PatternInstance, BackwardExtensionTiep
+from typing import List, Dict, Optional, Tuple, Iterator, TextIO
+from concurrent.futures import ProcessPoolExecutor, Future
+import multiprocessing
+import tempfile
+import shutil
+import os
+from tirpclo.data_types import SequenceDB, TiepProjector, BackwardExtensionTiep
 from tirpclo.tiep_index import TiepIndex
 from tirpclo import candidate_generation
 from tirpclo import closure_checking
@@ -8,6 +12,11 @@ from tirpclo import tirp_writing
 from tirpclo import projection
 from tirpclo import constants
 
+# start method of worker processes for parallel mining, under which workers inherit the mining state
+__PARALLEL_START_METHOD = 'fork'
+# mining state shared with the worker processes during parallel mining
+__parallel_mining_state: Optional[Tuple[TiepIndex, SequenceDB, int, int, bool]] = None
+
 
 def discover_tirps(
 		index: TiepIndex,
@@ -15,7 +24,8 @@ def discover_tirps(
 		min_support: int,
 		maximal_gap: int,
 		out_file: TextIO,
-		is_closed_tirp_mining: bool
+		is_closed_tirp_mining: bool,
+		num_workers: int = 1
 ) -> None:
 	"""
 	discovers all frequent TIRPs
@@ -25,105 +35,247 @@ def discover_tirps(
 	:param maximal_gap: (int) maximal gap
 	:param out_file: (TextIO) output file
 	:param is_closed_tirp_mining: (bool) whether mining only closed TIRPs or not
+	:param num_workers: (int) number of worker processes among which the TIRPs beginning with each start tiep
+		are mined (if greater than 1 and supported by the platform)
 	:return: (None)
 	"""
 
-	infrequent_tieps: List[str] = []
+	index.remove_infrequent_master_tieps(min_support)
+
+	initial_seq_db.filter_infrequent_tieps_from_initial_seq_db(index)
 
-	for tiep, master_tiep in index.master_tieps.items():
-		if len(master_tiep.supporting_entities) < min_support:
-			infrequent_tieps.append(tiep)
+	start_tieps: List[str] = [tiep for tiep in index.master_tieps if tiep[-1] == constants.START_REP]
 
-	for tiep in infrequent_tieps:
-		index.master_tieps.pop(tiep)
+	if num_workers > 1 and __PARALLEL_START_METHOD in multiprocessing.get_all_start_methods():
+		__discover_tirps_in_parallel(
+			index, initial_seq_db, start_tieps, min_support, maximal_gap, out_file, is_closed_tirp_mining, num_workers
+		)
+		return
 
-	initial_seq_db.filter_infrequent_tieps_from_initial_seq_db(index)
+	for tiep in start_tieps:
+		__discover_tirps_beginning_with_tiep(
+			index, initial_seq_db, tiep, min_support, maximal_gap, out_file, is_closed_tirp_mining
+		)
+
+
+def __discover_tirps_beginning_with_tiep(
+		index: TiepIndex,
+		initial_seq_db: SequenceDB,
+		tiep: str,
+		min_support: int,
+		maximal_gap: int,
+		out_file: TextIO,
+		is_closed_tirp_mining: bool
+) -> None:
+	"""
+	discovers all frequent TIRPs beginning with a given start tiep
+	:param index: (TiepIndex) main tiep index
+	:param initial_seq_db: (SequenceDB) initial sequence database, filtered from infrequent tieps
+	:param tiep: (str) frequent start tiep
+	:param min_support: (int) minimum vertical support threshold
+	:param maximal_gap: (int) maximal gap
+	:param out_file: (TextIO) output file
+	:param is_closed_tirp_mining: (bool) whether mining only closed TIRPs or not
+	:return: (None)
+	"""
+
+	projected_seq_db, may_be_closed, be_tieps_lists = projection.project_initial_seq_db(
+		initial_seq_db, tiep, index, maximal_gap, is_closed_tirp_mining
+	)
+	if not is_closed_tirp_mining or may_be_closed:
+		__extend_tirp(
+			index, projected_seq_db, index.rep_ids[tiep], None, min_support, maximal_gap,
+			out_file, be_tieps_lists, is_closed_tirp_mining
+		)
+
+
+def __discover_tirps_in_parallel(
+		index: TiepIndex,
+		initial_seq_db: SequenceDB,
+		start_tieps: List[str],
+		min_support: int,
+		maximal_gap: int,
+		out_file: TextIO,
+		is_closed_tirp_mining: bool,
+		num_workers: int
+) -> None:
+	"""
+	discovers all frequent TIRPs using a pool of worker processes, each mining the TIRPs beginning with
+		a start tiep at a time into a separate file; the files are then merged into the output file
+		in the order of the start tieps
+	:param index: (TiepIndex) main tiep index
+	:param initial_seq_db: (SequenceDB) initial sequence database, filtered from infrequent tieps
+	:param start_tieps: (List[str]) frequent start tieps
+	:param min_support: (int) minimum vertical support threshold
+	:param maximal_gap: (int) maximal gap
+	:param out_file: (TextIO) output file
+	:param is_closed_tirp_mining: (bool) whether mining only closed TIRPs or not
+	:param num_workers: (int) number of worker processes
+	:return: (None)
+	"""
+
+	global __parallel_mining_state
 
-	for tiep, master_tiep in index.master_tieps.items():
-		if tiep[-1] == constants.START_REP:
-			projected_seq_db, may_be_closed, be_tieps_lists = projection.project_initial_seq_db(
-				initial_seq_db, tiep, master_tiep.supporting_entities, index, maximal_gap, is_closed_tirp_mining
+	# the mining state is inherited by the forked workers rather than pickled
+	__parallel_mining_state = (index, initial_seq_db, min_support, maximal_gap, is_closed_tirp_mining)
+	out_file.flush()
+
+	try:
+		with tempfile.TemporaryDirectory() as tirps_dir:
+			tirps_file_paths: List[str] = [os.path.join(tirps_dir, f'{i}.txt') for i in range(len(start_tieps))]
+			# the start tieps are submitted in descending order of support, so that the ones likely to begin
+			# the largest search trees do not end up as the last running jobs
+			submission_order: List[int] = sorted(
+				range(len(start_tieps)), key=lambda i: -len(index.master_tieps[start_tieps[i]].supporting_entities)
 			)
-			if not is_closed_tirp_mining or may_be_closed:
-				__extend_tirp(
-					index, projected_seq_db, tiep, None, min_support, maximal_gap,
-					out_file, be_tieps_lists, is_closed_tirp_mining
-				)
+			with ProcessPoolExecutor(
+					max_workers=num_workers, mp_context=multiprocessing.get_context(__PARALLEL_START_METHOD)
+			) as executor:
+				futures: List[Future] = [
+					executor.submit(__discover_tirps_beginning_with_tiep_in_worker, start_tieps[i], tirps_file_paths[i])
+					for i in submission_order
+				]
+				for future in futures:
+					future.result()
+
+			for tirps_file_path in tirps_file_paths:
+				with open(tirps_file_path, 'r') as tirps_file:
+					shutil.copyfileobj(tirps_file, out_file)
+
+	finally:
+		__parallel_mining_state = None
+
+
+def __discover_tirps_beginning_with_tiep_in_worker(
+		tiep: str,
+		tirps_file_path: str
+) -> None:
+	"""
+	discovers all frequent TIRPs beginning with a given start tiep within a worker process
+	:param tiep: (str) frequent start tiep
+	:param tirps_file_path: (str) path to the file into which the TIRPs are written
+	:return: (None)
+	"""
+
+	index, initial_seq_db, min_support, maximal_gap, is_closed_tirp_mining = __parallel_mining_state
+	with open(tirps_file_path, 'w') as tirps_file:
+		__discover_tirps_beginning_with_tiep(
+			index, initial_seq_db, tiep, min_support, maximal_gap, tirps_file, is_closed_tirp_mining
+		)
 
 
 def __extend_tirp(
 		index: TiepIndex,
 		pattern_seq_db: SequenceDB,
-		pattern_last_tiep: str,
-		previous_tiep_projectors: Optional[Dict[str, TiepProjector]],
+		pattern_last_tiep_id: int,
+		previous_tiep_projectors: Optional[Dict[int, TiepProjector]],
 		min_support: int,
 		maximal_gap: int,
 		out_file: TextIO,
-		be_tieps_lists: Optional[Dict[str, List[BackwardExtensionTiep]]],
+		be_tieps_lists: Optional[Dict[int, List[BackwardExtensionTiep]]],
 		is_closed_tirp_mining: bool
 ) -> None:
 	"""
-	recursively extends a current pattern
+	extends a current pattern, as well as every pattern extending it in turn, in a depth-first order; rather than
+		recursing, the patterns being extended are kept within an explicit stack, so that the length of the
+		discovered TIRPs is not bounded by the interpreter's recursion limit
 	:param index: (TiepIndex) main tiep index
 	:param pattern_seq_db: (SequenceDB) projected sequence database
-	:param pattern_last_tiep: (str) last tiep of current pattern represented by the sequence database
-	:param previous_tiep_projectors: (Optional[Dict[str, TiepProjector]]) mapping of all previous tiep-projectors,
+	:param pattern_last_tiep_id: (int) id of last tiep of current pattern represented by the sequence database
+	:param previous_tiep_projectors: (Optional[Dict[int, TiepProjector]]) mapping of all previous tiep-projectors,
 		based on which new tiep-projectors are created
 	:param min_support: (int) minimum vertical support threshold
 	:param maximal_gap: (int) maximal gap
 	:param out_file: (TextIO) output file
-	:param be_tieps_lists: (Optional[Dict[str, List[BackwardExtensionTiep]]]) backward-extension tieps
+	:param be_tieps_lists: (Optional[Dict[int, List[BackwardExtensionTiep]]]) backward-extension tieps
 	:param is_closed_tirp_mining: (bool) whether mining only closed TIRPs or not
 	:return: (None)
 	"""
 
-	tiep_projectors: Dict[str, TiepProjector] = candidate_generation.get_tiep_projectors(
-		pattern_seq_db, pattern_last_tiep, previous_tiep_projectors,
-		index, min_support, maximal_gap, is_closed_tirp_mining
+	tiep_projectors: Dict[int, TiepProjector] = __visit_pattern(
+		index, pattern_seq_db, pattern_last_tiep_id, previous_tiep_projectors, min_support, maximal_gap,
+		out_file, be_tieps_lists, is_closed_tirp_mining
 	)
+	# every pattern being extended along with its tiep-projectors and its yet unvisited candidate extensions
+	stack: List[Tuple[SequenceDB, Dict[int, TiepProjector], Iterator[Tuple[int, TiepProjector]]]] = [
+		(pattern_seq_db, tiep_projectors, iter(tiep_projectors.items()))
+	]
 
-	if __all_in_pairs(pattern_seq_db.db):
-		if not is_closed_tirp_mining or closure_checking.may_tirp_be_closed(
-				pattern_seq_db, tiep_projectors, be_tieps_lists
-		):
-			tirp_writing.write_tirp(pattern_seq_db, out_file)
-
-	for tiep, tiep_projector in tiep_projectors.items():
+	while len(stack) > 0:
+		pattern_seq_db, tiep_projectors, candidate_extensions = stack[-1]
 
-		if len(tiep_projector.supporting_entities) < min_support:
-			continue
+		for tiep_id, tiep_projector in candidate_extensions:
 
-		if is_closed_tirp_mining and tiep[-1] == constants.FINISH_REP:
-			tirp_primitive_rep = tiep[1:] if tiep[0] == constants.CO_REP else tiep
-			if tirp_primitive_rep not in pattern_seq_db.pre_matched:
+			if len(tiep_projector.supporting_entities) < min_support:
 				continue
 
-		projected_seq_db: SequenceDB = projection.project_projected_seq_db(
-			pattern_seq_db, tiep, tiep_projector, index, maximal_gap, is_closed_tirp_mining
-		)
+			tiep: str = index.reps[tiep_id]
+
+			if is_closed_tirp_mining and tiep[-1] == constants.FINISH_REP:
+				tirp_primitive_rep = tiep[1:] if tiep[0] == constants.CO_REP else tiep
+				if tirp_primitive_rep not in pattern_seq_db.pre_matched:
+					continue
+
+			projected_seq_db: SequenceDB = projection.project_projected_seq_db(
+				pattern_seq_db, tiep, tiep_projector, index, maximal_gap, is_closed_tirp_mining
+			)
+
+			if projected_seq_db.support >= min_support:
+				may_be_closed: bool = True
+				current_be_tieps_lists: Optional[Dict[int, List[BackwardExtensionTiep]]] = None
+				if is_closed_tirp_mining:
+					may_be_closed, current_be_tieps_lists = closure_checking.back_scan(projected_seq_db, maximal_gap)
+				if may_be_closed:
+					# the extended pattern is fully extended before the next candidate extension of the current one
+					extended_tiep_projectors: Dict[int, TiepProjector] = __visit_pattern(
+						index, projected_seq_db, tiep_id, tiep_projectors, min_support, maximal_gap,
+						out_file, current_be_tieps_lists, is_closed_tirp_mining
+					)
+					stack.append(
+						(projected_seq_db, extended_tiep_projectors, iter(extended_tiep_projectors.items()))
+					)
+					break
+
+		else:
+			stack.pop()
 
-		if projected_seq_db.support >= min_support:
-			may_be_closed: bool = True
-			current_be_tieps_lists: Optional[Dict[str, List[BackwardExtensionTiep]]] = None
-			if is_closed_tirp_mining:
-				may_be_closed, current_be_tieps_lists = closure_checking.back_scan(projected_seq_db, maximal_gap)
-			if may_be_closed:
-				__extend_tirp(
-					index, projected_seq_db, tiep, tiep_projectors, min_support, maximal_gap,
-					out_file, current_be_tieps_lists, is_closed_tirp_mining
-				)
-
-
-def __all_in_pairs(
-		pattern_db: List[Tuple[CoincidenceSequence, PatternInstance]]
-) -> bool:
+
+def __visit_pattern(
+		index: TiepIndex,
+		pattern_seq_db: SequenceDB,
+		pattern_last_tiep_id: int,
+		previous_tiep_projectors: Optional[Dict[int, TiepProjector]],
+		min_support: int,
+		maximal_gap: int,
+		out_file: TextIO,
+		be_tieps_lists: Optional[Dict[int, List[BackwardExtensionTiep]]],
+		is_closed_tirp_mining: bool
+) -> Dict[int, TiepProjector]:
 	"""
-	returns whether current pattern does not include start-tieps without their complementing finish-tieps,
-		and thus represents a TIRP
-	:param pattern_db: (List[Tuple[CoincidenceSequence, PatternInstance]]) records of a current pattern's
-		sequence database
-	:return: (bool) whether current pattern does not include start-tieps without their complementing finish-tieps,
-		and thus represents a TIRP
+	generates the candidate extensions of a current pattern, and writes it if it represents a (closed) TIRP
+	:param index: (TiepIndex) main tiep index
+	:param pattern_seq_db: (SequenceDB) projected sequence database
+	:param pattern_last_tiep_id: (int) id of last tiep of current pattern represented by the sequence database
+	:param previous_tiep_projectors: (Optional[Dict[int, TiepProjector]]) mapping of all previous tiep-projectors,
+		based on which new tiep-projectors are created
+	:param min_support: (int) minimum vertical support threshold
+	:param maximal_gap: (int) maximal gap
+	:param out_file: (TextIO) output file
+	:param be_tieps_lists: (Optional[Dict[int, List[BackwardExtensionTiep]]]) backward-extension tieps
+	:param is_closed_tirp_mining: (bool) whether mining only closed TIRPs or not
+	:return: (Dict[int, TiepProjector]) mapping of the tiep-projectors of the current pattern
 	"""
 
-	return len(pattern_db[0][1].pre_matched) == 0
+	tiep_projectors: Dict[int, TiepProjector] = candidate_generation.get_tiep_projectors(
+		pattern_seq_db, pattern_last_tiep_id, previous_tiep_projectors,
+		index, min_support, maximal_gap, is_closed_tirp_mining
+	)
+
+	# the current pattern represents a TIRP if it does not include start-tieps without their complementing finish-tieps
+	if pattern_seq_db.db[0][1].is_complete:
+		if not is_closed_tirp_mining or closure_checking.may_tirp_be_closed(
+				pattern_seq_db, tiep_projectors, be_tieps_lists, index
+		):
+			tirp_writing.write_tirp(pattern_seq_db, out_file)
+
+	return tiep_projectors
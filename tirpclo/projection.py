@@ -1,75 +1,62 @@
-from typing import List, Optional, Tuple, Dict
-import copy
+from typing import List, Optional, Tuple, Dict, Set, FrozenSet, Sequence
 from tirpclo.data_types import SequenceDB, CoincidenceSequence, PatternInstance, Tiep, \
 	TiepProjector, Coincidence, BackwardExtensionTiep
 from tirpclo.tiep_index import TiepIndex, MasterTiep
 from tirpclo import closure_checking
 from tirpclo import constants
-from tirpclo import utils
 
 
 def project_initial_seq_db(
 		initial_seq_db: SequenceDB,
 		tiep_primitive_rep: str,
-		supporting_entities: List[str],
 		index: TiepIndex,
 		maximal_gap: int,
 		is_closed_tirp_mining: bool
-) -> Tuple[SequenceDB, Optional[bool], Optional[Dict[str, List[BackwardExtensionTiep]]]]:
+) -> Tuple[SequenceDB, Optional[bool], Optional[Dict[int, List[BackwardExtensionTiep]]]]:
 	"""
 	projects initial sequence database by a tiep
 	:param initial_seq_db: (SequenceDB) initial sequence database
 	:param tiep_primitive_rep: (str) tiep for projection
-	:param supporting_entities: (List[str]) list of supporting entities of the tiep
 	:param index: (TiepIndex) main tiep index
 	:param maximal_gap: (int) maximal gap
 	:param is_closed_tirp_mining: (bool) whether mining only closed TIRPs or not
-	:return: (Tuple[SequenceDB, bool, Dict[str, List[BackwardExtensionTiep]]]) projected sequence database, as well as
+	:return: (Tuple[SequenceDB, bool, Dict[int, List[BackwardExtensionTiep]]]) projected sequence database, as well as
 		whether the projected pattern has the potential of being closed and its backward-extension tieps
 	"""
 
 	projected_db: List[Tuple[CoincidenceSequence, PatternInstance]] = []
 	master_tiep: MasterTiep = index.master_tieps[tiep_primitive_rep]
-	cumulative_be_tieps: Optional[Dict[str, BackwardExtensionTiep]] = None
+	cumulative_be_tieps: Optional[Dict[int, BackwardExtensionTiep]] = None
 	entry_index: int = 0
+	# the tiep instances are indexed by exactly the supporting entities of the tiep
+	tiep_occurrences: Dict[str, List[Tiep]] = master_tiep.tiep_occurrences
 
-	for coincidence_seq, pattern_instance in initial_seq_db.db:
+	for coincidence_seq, _ in initial_seq_db.db:
 		entity_id: str = coincidence_seq.entity
-		if entity_id not in supporting_entities:
+		if entity_id not in tiep_occurrences:
 			continue
 
-		entity_tiep_instances: List[Tiep] = master_tiep.tiep_occurrences[entity_id]
-		entity_be_tieps: Dict[str, BackwardExtensionTiep] = {}
-		for i, tiep_instance in enumerate(entity_tiep_instances):
-			projected_record: Optional[CoincidenceSequence] = __project_seq_by_tiep_instance(
-				tiep_instance, tiep_primitive_rep, coincidence_seq, pattern_instance
-			)
-
-			if projected_record is not None:
-				extended_pattern_instance: PatternInstance = PatternInstance()
-				if is_closed_tirp_mining:
-					extended_pattern_instance.next_coincidences.append(coincidence_seq.first_co)
-				extended_pattern_instance.extend_pattern_instance(
-					tiep_instance, projected_record.first_co, is_closed_tirp_mining
+		entity_tiep_instances: List[Tiep] = tiep_occurrences[entity_id]
+		projected_db.extend(
+			__project_initial_seq_by_tiep_instances(entity_tiep_instances, coincidence_seq, is_closed_tirp_mining)
+		)
+
+		if is_closed_tirp_mining:
+			entity_be_tieps: Dict[int, BackwardExtensionTiep] = {}
+			for i, tiep_instance in enumerate(entity_tiep_instances):
+				closure_checking.collect_be_tieps_wrt_tiep_instance(
+					tiep_instance, coincidence_seq.first_co if i == 0 else entity_tiep_instances[i - 1].coincidence,
+					entry_index, entity_be_tieps, cumulative_be_tieps, maximal_gap
 				)
-				projected_db.append((projected_record, extended_pattern_instance))
-
-				if is_closed_tirp_mining:
-					closure_checking.collect_be_tieps_wrt_tiep_instance(
-						tiep_instance, coincidence_seq.first_co if i == 0 else entity_tiep_instances[i - 1].coincidence,
-						entry_index, entity_be_tieps, cumulative_be_tieps, maximal_gap
-					)
-
 				entry_index += 1
+			cumulative_be_tieps = entity_be_tieps
 
-		cumulative_be_tieps = entity_be_tieps
-
-	be_tieps_lists: Optional[Dict[str, List[BackwardExtensionTiep]]] = None
+	be_tieps_lists: Optional[Dict[int, List[BackwardExtensionTiep]]] = None
 	may_be_closed: Optional[bool] = None
-	pre_matched: Optional[List[str]] = None
+	pre_matched: Optional[FrozenSet[str]] = None
 	if is_closed_tirp_mining:
 		may_be_closed, be_tieps_lists = closure_checking.finalize_initial_be_tieps(cumulative_be_tieps)
-		pre_matched = [tiep_primitive_rep.replace(constants.START_REP, constants.FINISH_REP)]
+		pre_matched = frozenset((index.reps[master_tiep.complement_rep_id],))
 
 	return SequenceDB(
 		projected_db, None, len(master_tiep.supporting_entities), pre_matched
@@ -95,8 +82,13 @@ def project_projected_seq_db(
 	:return: (SequenceDB) projected sequence database
 	"""
 
-	projected_db: List[Tuple[CoincidenceSequence, PatternInstance]] = []
-	projected_indices: List[int] = []
+	# pre-allocated according to the number of entries to project, which bounds the number of projected records
+	# when at most a single tiep instance is projected per entry (i.e., for co-occurrence, meet & finish tieps)
+	first_indices: Dict[int, int] = tiep_projector.first_indices
+	projected_capacity: int = len(first_indices)
+	projected_db: List[Optional[Tuple[CoincidenceSequence, PatternInstance]]] = [None] * projected_capacity
+	projected_indices: List[int] = [0] * projected_capacity
+	projected_count: int = 0
 
 	base_tiep_form: str = tiep
 	is_meet: bool = False
@@ -110,132 +102,180 @@ def project_projected_seq_db(
 		is_co = True
 		base_tiep_form = base_tiep_form[1:]
 
-	master_tiep: MasterTiep = index.master_tieps[base_tiep_form]
+	master_tiep_id: int = index.rep_ids[base_tiep_form]
+	master_tiep: MasterTiep = index.master_tieps_list[master_tiep_id]
 	is_start_tiep: bool = base_tiep_form[-1] == constants.START_REP
-	supporting_entities: List[str] = []
+	is_single_instance_per_entry: bool = is_co or is_meet or not is_start_tiep
+	supporting_entities: Set[str] = set()
 
-	for db_entry_index, first_index in tiep_projector.first_indices.items():
-		coincidence_seq, pattern_instance = seq_db.db[db_entry_index]
+	# local bindings for the hot loop
+	db: List[Tuple[CoincidenceSequence, PatternInstance]] = seq_db.db
+	tiep_occurrences: Dict[str, List[Tiep]] = master_tiep.tiep_occurrences
+
+	for db_entry_index, first_index in first_indices.items():
+		coincidence_seq, pattern_instance = db[db_entry_index]
 		entity_id: str = coincidence_seq.entity
-		entity_tiep_instances: List[Tiep] = master_tiep.tiep_occurrences[entity_id]
+		entity_tiep_instances: List[Tiep] = tiep_occurrences[entity_id]
+		first_expected_finish_time: float = pattern_instance.first_expected_finish_time
+		# the maximal gap holds for a start tiep only if it starts before this bound
+		gap_upper_bound: float = pattern_instance.minimal_finish_time + maximal_gap if is_start_tiep else float('inf')
 
 		for i in range(first_index, len(entity_tiep_instances)):
-			if entity_tiep_instances[i].time > pattern_instance.first_expected_finish_time:
-				continue
-			if is_start_tiep and not utils.max_gap_holds(
-					pattern_instance.minimal_finish_time, entity_tiep_instances[i], maximal_gap
-			):
-				break
-
 			tiep_instance: Tiep = entity_tiep_instances[i]
+			# the tiep instances are ordered by time, hence the first one occurring after the expected finish time
+			# or violating the maximal gap bounds all the following ones as well
+			if tiep_instance.time > first_expected_finish_time or tiep_instance.time >= gap_upper_bound:
+				break
 			projected_record: Optional[CoincidenceSequence] = __project_seq_by_tiep_instance(
-				tiep_instance, tiep, coincidence_seq, pattern_instance
+				tiep_instance, is_co, coincidence_seq, pattern_instance
 			)
 
 			if projected_record is not None:
-				if entity_id not in supporting_entities:
-					supporting_entities.append(entity_id)
-				extended_pattern_instance: PatternInstance = PatternInstance()
-				extended_pattern_instance.pre_extend_copy(pattern_instance, is_closed_tirp_mining)
+				supporting_entities.add(entity_id)
+				extended_pattern_instance: PatternInstance = pattern_instance.copy_for_extension(is_closed_tirp_mining)
 				extended_pattern_instance.extend_pattern_instance(
 					tiep_instance, projected_record.first_co, is_closed_tirp_mining
 				)
-				projected_db.append((projected_record, extended_pattern_instance))
-				projected_indices.append(db_entry_index)
-
-			if is_co or is_meet or not is_start_tiep:
+				if projected_count < projected_capacity:
+					projected_db[projected_count] = (projected_record, extended_pattern_instance)
+					projected_indices[projected_count] = db_entry_index
+				else:
+					projected_db.append((projected_record, extended_pattern_instance))
+					projected_indices.append(db_entry_index)
+				projected_count += 1
+
+			if is_single_instance_per_entry:
 				break
 
-	pre_matched: Optional[List[str]] = None
+	del projected_db[projected_count:]
+	del projected_indices[projected_count:]
+
+	pre_matched: Optional[FrozenSet[str]] = None
 	if is_closed_tirp_mining:
-		pre_matched = seq_db.pre_matched.copy()
-		if base_tiep_form[-1] == constants.START_REP:
-			pre_matched.append(base_tiep_form.replace(constants.START_REP, constants.FINISH_REP))
+		if is_start_tiep:
+			pre_matched = seq_db.pre_matched | {index.reps[master_tiep.complement_rep_id]}
 		else:
-			pre_matched.remove(base_tiep_form)
+			pre_matched = seq_db.pre_matched - {base_tiep_form}
 
 	return SequenceDB(projected_db, projected_indices, len(supporting_entities), pre_matched)
 
 
+def __project_initial_seq_by_tiep_instances(
+		entity_tiep_instances: List[Tiep],
+		coincidence_seq: CoincidenceSequence,
+		is_closed_tirp_mining: bool
+) -> List[Tuple[CoincidenceSequence, PatternInstance]]:
+	"""
+	projects an initial coincidence sequence by each of the instances of a start tiep within it; unlike a general
+		projection, it always succeeds, as every start tiep instance is found within its own coincidence
+		and no pattern instance constraints apply yet
+	:param entity_tiep_instances: (List[Tiep]) instances of the start tiep within the entity
+	:param coincidence_seq: (CoincidenceSequence) initial coincidence sequence of the entity
+	:param is_closed_tirp_mining: (bool) whether mining only closed TIRPs or not
+	:return: (List[Tuple[CoincidenceSequence, PatternInstance]]) projected records, one per tiep instance
+	"""
+
+	entity_id: str = coincidence_seq.entity
+	first_co: Optional[Coincidence] = coincidence_seq.first_co
+	projected_records: List[Tuple[CoincidenceSequence, PatternInstance]] = []
+
+	for tiep_instance in entity_tiep_instances:
+		tiep_coincidence: Coincidence = tiep_instance.coincidence
+		co_tieps: Sequence[Tiep] = tiep_coincidence.get_co_tieps_after(
+			__find_tiep_position(tiep_coincidence.tieps, tiep_instance, False)
+		)
+
+		if len(co_tieps) == 0:
+			projected_record: CoincidenceSequence = CoincidenceSequence(
+				entity_id, tiep_coincidence.next, coincidences=coincidence_seq.coincidences
+			)
+		else:
+			projected_seq_first_co: Coincidence = Coincidence(
+				tiep_coincidence.index, is_co=True, tieps=co_tieps, next=tiep_coincidence.next
+			)
+			projected_record: CoincidenceSequence = CoincidenceSequence(
+				entity_id, projected_seq_first_co, projected_seq_first_co, coincidence_seq.coincidences
+			)
+
+		extended_pattern_instance: PatternInstance = PatternInstance()
+		if is_closed_tirp_mining:
+			extended_pattern_instance.next_coincidences.append(first_co)
+		extended_pattern_instance.extend_pattern_instance(
+			tiep_instance, projected_record.first_co, is_closed_tirp_mining
+		)
+		projected_records.append((projected_record, extended_pattern_instance))
+
+	return projected_records
+
+
 def __project_seq_by_tiep_instance(
 		tiep_instance: Tiep,
-		tiep: str,
+		is_co_tiep: bool,
 		coincidence_seq: CoincidenceSequence,
 		pattern_instance: PatternInstance
 ) -> Optional[CoincidenceSequence]:
 	"""
 	projects a coincidence sequence by a tiep and returns the projected sequence
 	:param tiep_instance: (Tiep) specific tiep instance
-	:param tiep: (str) tiep representation
+	:param is_co_tiep: (bool) whether the tiep is a co-occurrence tiep
 	:param coincidence_seq: (CoincidenceSequence) coincidence sequence to project
 	:param pattern_instance: (PatternInstance) respective pattern instance
 	:return: (Optional[CoincidenceSequence]) projected coincidence sequence, if succeeded
 	"""
 
-	first_projected_co, succeeded = __get_projected_coincidence_seq(
-		tiep_instance, tiep, coincidence_seq, pattern_instance
-	)
-	if not succeeded:
+	tiep_coincidence: Coincidence = tiep_instance.coincidence
+	partial_co: Optional[Coincidence] = coincidence_seq.partial_co
+	if partial_co is not None and partial_co.index == tiep_coincidence.index:
+		current_coincidence: Coincidence = partial_co
+	else:
+		current_coincidence: Coincidence = tiep_coincidence
+
+	coincidence_tieps: Sequence[Tiep] = current_coincidence.tieps
+	i: int = __find_tiep_position(coincidence_tieps, tiep_instance, is_co_tiep)
+	if i < 0:
+		return None
+
+	current_tiep: Tiep = coincidence_tieps[i]
+	if current_tiep.type == constants.FINISH_REP and not __is_tiep_valid_for_extension(
+			current_tiep, pattern_instance
+	):
 		return None
 
-	cs: CoincidenceSequence = CoincidenceSequence(
-		coincidence_seq.entity,
-		first_projected_co,
-		first_projected_co if first_projected_co is not None and first_projected_co.index == tiep_instance.coincidence.index else None
+	# the projected sequence begins with the partially projected coincidence, unless no tieps are left within it
+	co_tieps: Sequence[Tiep] = current_coincidence.get_co_tieps_after(i)
+	if len(co_tieps) == 0:
+		return CoincidenceSequence(coincidence_seq.entity, current_coincidence.next)
+
+	projected_seq_first_co: Coincidence = Coincidence(
+		current_coincidence.index, is_co=True, tieps=co_tieps, next=current_coincidence.next
 	)
-	return cs
+	return CoincidenceSequence(coincidence_seq.entity, projected_seq_first_co, projected_seq_first_co)
 
 
-def __get_projected_coincidence_seq(
+def __find_tiep_position(
+		coincidence_tieps: Sequence[Tiep],
 		tiep_instance: Tiep,
-		tiep: str,
-		coincidence_seq: CoincidenceSequence,
-		pattern_instance: PatternInstance
-) -> Tuple[Optional[Coincidence], bool]:
+		match_orig_tiep: bool
+) -> int:
 	"""
-	returns first coincidence from which the projected coincidence sequence begins after projection by a tiep,
-		if projection is possible
-	:param tiep_instance: (Tiep) specific tiep instance
-	:param tiep: (str) tiep representation
-	:param coincidence_seq: (CoincidenceSequence) coincidence sequence to project
-	:param pattern_instance: (PatternInstance) respective pattern instance
-	:return: (Tuple[Optional[Coincidence], bool]) tuple of
-		<first coincidence of projected sequence, projection success status>
+	returns the position of a tiep instance within the tieps of a coincidence
+	:param coincidence_tieps: (Sequence[Tiep]) tieps of the coincidence
+	:param tiep_instance: (Tiep) specific tiep instance to look for
+	:param match_orig_tiep: (bool) whether to match against the original tiep of each coinciding tiep
+		(relevant for co-occurrence tieps only)
+	:return: (int) position of the tiep instance within the coincidence, or -1 if not found
 	"""
 
-	if coincidence_seq.partial_co is not None and coincidence_seq.partial_co.index == tiep_instance.coincidence.index:
-		current_coincidence: Coincidence = coincidence_seq.partial_co
+	if match_orig_tiep:
+		for i in range(len(coincidence_tieps)):
+			if coincidence_tieps[i].orig_tiep is tiep_instance:
+				return i
 	else:
-		current_coincidence: Coincidence = tiep_instance.coincidence
-
-	coincidence_tieps: List[Tiep] = current_coincidence.tieps
-	for i in range(len(coincidence_tieps)):
-		found: bool = tiep_instance == coincidence_tieps[i].orig_tiep if tiep[0] == constants.CO_REP else coincidence_tieps[i] == tiep_instance
-		if found:
-			current_tiep: Tiep = coincidence_tieps[i]
-			if current_tiep.type == constants.FINISH_REP and not __is_tiep_valid_for_extension(
-					current_tiep, pattern_instance
-			):
-				return None, False
-
-			projected_seq_first_co: Coincidence = Coincidence(current_coincidence.index, is_co=True)
-			if i < len(coincidence_tieps) - 1:
-				for k in range(i + 1, len(coincidence_tieps)):
-					if current_coincidence.is_co:
-						current_tiep = coincidence_tieps[k]
-					else:
-						current_tiep = copy.copy(coincidence_tieps[k])
-						current_tiep.orig_tiep = coincidence_tieps[k]
-					projected_seq_first_co.tieps.append(current_tiep)
-
-			projected_seq_first_co.next = current_coincidence.next
-
-			if len(projected_seq_first_co.tieps) == 0:
-				projected_seq_first_co = projected_seq_first_co.next
-
-			return projected_seq_first_co, True
+		for i in range(len(coincidence_tieps)):
+			if coincidence_tieps[i] is tiep_instance:
+				return i
 
-	return None, False
+	return -1
 
 
 def __is_tiep_valid_for_extension(
@@ -249,4 +289,4 @@ def __is_tiep_valid_for_extension(
 	:return: (bool) whether it is valid to extend the current pattern instance by the given tiep or not
 	"""
 
-	return tiep.sti in pattern_instance.pre_matched
+	return id(tiep.sti) in pattern_instance.pre_matched
@@ -1,4 +1,4 @@
-from typing.io import TextIO
+from typing import TextIO
 import math
 import time
 from tirpclo.data_types import SequenceDB
@@ -27,7 +27,8 @@ def run_tirpclo(run_config: utils.RunConfig) -> None:
     index: TiepIndex = TiepIndex()
     initial_seq_db: SequenceDB = stis2seq.transform_input_file_to_seq_db(run_config.in_file_path, index)
     main_algorithm.discover_tirps(
-        index, initial_seq_db, min_support, run_config.maximal_gap, out_file, run_config.is_closed_tirp_mining
+        index, initial_seq_db, min_support, run_config.maximal_gap, out_file, run_config.is_closed_tirp_mining,
+        run_config.num_workers
     )
 
     end_time: float = time.time()
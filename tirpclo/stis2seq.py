@@ -1,9 +1,14 @@
-from typing import List, Tuple, Optional
+from typing import List, Tuple, Optional, Dict, Iterator
 from pathlib import Path
+from operator import attrgetter
+import gc
 from tirpclo.data_types import STI, Tiep, Coincidence, CoincidenceSequence, PatternInstance, SequenceDB
 from tirpclo.tiep_index import TiepIndex
 from tirpclo import constants
 
+# order of the stis of an end-time, where stis of the same symbol keep their order of addition
+__STI_SYMBOL_KEY = attrgetter('symbol')
+
 
 class EndTime:
     """this class represents an End-Time, i.e., collection of co-occurring STI end-points having the same type
@@ -20,43 +25,12 @@ class EndTime:
 
     def add_sti(self, new_sti: STI) -> None:
         """
-        adds an STI to the end-time
+        adds an STI to the end-time; the stis are ordered by symbol only once all have been added
         :param new_sti: (STI) STI to add
         :return: (None)
         """
 
-        min_idx: int = 0
-        max_idx: int = len(self.stis) - 1
-
-        while min_idx <= max_idx:
-            mid: int = (min_idx + max_idx) // 2
-            diff: int = new_sti.symbol - self.stis[mid].symbol
-            if diff < 0:
-                max_idx = mid - 1
-            else:
-                min_idx = mid + 1
-
-        self.stis.insert(min_idx, new_sti)
-
-    def compare(self, other: 'EndTime') -> int:
-        """
-        compares current end-time to other end-time
-        :param other: (EndTime) end-time to compare
-        :return: (int) comparison result of current end-time and other end-time
-        """
-
-        time_diff: int = self.entry_time - other.entry_time
-        if time_diff != 0:
-            return time_diff
-
-        type_diff: bool = self.entry_type == other.entry_type
-        if not type_diff:
-            if self.entry_type == constants.FINISH:
-                return -1
-            else:
-                return 1
-
-        return 0
+        self.stis.append(new_sti)
 
 
 def transform_input_file_to_seq_db(
@@ -73,103 +47,95 @@ def transform_input_file_to_seq_db(
     if not Path(in_file_path).is_file():
         raise Exception(constants.IN_FILE_NOT_EXISTS_ERR)
 
+    # the file is read at once and split into lines, rather than read line by line
     with open(in_file_path, 'r') as in_file:
-
-        # move on until the significant start
-        while line := in_file.readline():
-            if line.startswith(constants.FILE_START):
+        lines: Iterator[str] = iter(in_file.read().split('\n'))
+
+    # move on until the significant start
+    line: str = ''
+    for line in lines:
+        if line.startswith(constants.FILE_START):
+            break
+    if not (line.startswith(constants.FILE_START) and next(lines, '').startswith(constants.FILE_NUM)):
+        raise Exception(constants.IN_FILE_FORMAT_ERR)
+
+    # start reading the entities
+    seq_db: List[Tuple[CoincidenceSequence, PatternInstance]] = []
+    # the many objects built while reading are all kept, hence collecting garbage meanwhile is futile
+    is_gc_enabled: bool = gc.isenabled()
+    gc.disable()
+    try:
+        for line in lines:
+            line = line.strip()
+            if not line:
                 break
-        if not (line.startswith(constants.FILE_START) and in_file.readline().startswith(constants.FILE_NUM)):
-            raise Exception(constants.IN_FILE_FORMAT_ERR)
-
-        # start reading the entities
-        seq_db: List[Tuple[CoincidenceSequence, PatternInstance]] = []
-        while line := in_file.readline().strip():
 
             entity_id: str = line.split(';')[0].split(',')[0]
 
-            line = in_file.readline().strip()
-            stis_line_components = line.split(';')
-            end_time_list: List[EndTime] = []
-
-            for i in range(len(stis_line_components) - 1):
-                sti_components: List[str] = stis_line_components[i].split(',')
-                sti: STI = STI(
-                    start_time=int(sti_components[constants.STI_START_INDEX]),
-                    finish_time=int(sti_components[constants.STI_FINISH_INDEX]),
-                    symbol=int(sti_components[constants.STI_SYMBOL_INDEX])
-                )
-                __add_sti_to_end_times(sti, end_time_list)
+            # every STI is terminated by ';', hence anything following the last ';' is ignored
+            stis_line: str = next(lines, '').strip().rpartition(';')[0]
+            end_times: Dict[Tuple[int, bool], EndTime] = {}
+
+            if stis_line:
+                # the fields of all STIs are parsed at once, then sliced into STIs of a fixed number of fields
+                num_sti_fields: int = stis_line.split(';', 1)[0].count(',') + 1
+                sti_fields: List[int] = list(map(int, stis_line.replace(';', ',').split(',')))
+                for i in range(0, len(sti_fields), num_sti_fields):
+                    sti: STI = STI(
+                        start_time=sti_fields[i + constants.STI_START_INDEX],
+                        finish_time=sti_fields[i + constants.STI_FINISH_INDEX],
+                        symbol=sti_fields[i + constants.STI_SYMBOL_INDEX]
+                    )
+                    __add_sti_to_end_times(sti, end_times)
 
             coincidence_seq: CoincidenceSequence = __convert_event_seq_to_coincidence_seq(
-                entity_id, end_time_list, tiep_index
+                entity_id, __get_ordered_end_times(end_times), tiep_index
             )
             pattern_instance: PatternInstance = PatternInstance()
             seq_db.append((coincidence_seq, pattern_instance))
+    finally:
+        if is_gc_enabled:
+            gc.enable()
 
     return SequenceDB(seq_db, None, 0, None)
 
 
 def __add_sti_to_end_times(
         sti: STI,
-        end_time_list: List[EndTime]
+        end_times: Dict[Tuple[int, bool], EndTime]
 ) -> None:
     """
-    adds the end-points of an STI to the end-time list
+    adds the end-points of an STI to the end-times
     :param sti: (STI) input STI to add
-    :param end_time_list: (List[EndTime]) cumulative end-time list
+    :param end_times: (Dict[Tuple[int, bool], EndTime]) cumulative end-times by time & type
     :return: (None)
     """
 
-    start_end_time: EndTime = EndTime(sti, sti.start_time, constants.START)
-    finish_end_time: EndTime = EndTime(sti, sti.finish_time, constants.FINISH)
-    __add_point_to_end_times(start_end_time, end_time_list)
-    __add_point_to_end_times(finish_end_time, end_time_list)
-
-
-def __add_point_to_end_times(
-        new_et: EndTime,
-        end_time_list: List[EndTime]
-) -> None:
-    """
-    adds an end-point to the end-time list in an ordered manner
-    :param new_et: (EndTime) end-time of additional end-point
-    :param end_time_list: (List[EndTime]) cumulative end-time list
-    :return: (None)
-    """
-
-    place, end_time = __get_end_time_place(new_et, end_time_list)
-    if place >= 0:
-        end_time_list.insert(place, new_et)
-    else:
-        end_time.add_sti(new_et.stis[0])
+    for entry_time, entry_type in ((sti.start_time, constants.START), (sti.finish_time, constants.FINISH)):
+        end_time: Optional[EndTime] = end_times.get((entry_time, entry_type))
+        if end_time is None:
+            end_times[(entry_time, entry_type)] = EndTime(sti, entry_time, entry_type)
+        else:
+            end_time.add_sti(sti)
 
 
-def __get_end_time_place(
-        end_time: EndTime,
-        end_time_list: List[EndTime]
-) -> Tuple[int, Optional[EndTime]]:
+def __get_ordered_end_times(
+        end_times: Dict[Tuple[int, bool], EndTime]
+) -> List[EndTime]:
     """
-    finds the correct place within the ordered end-time list for the additional end-time
-    :param end_time: (EndTime) end-time of additional end-point
-    :param end_time_list: (List[EndTime]) cumulative end-time list
-    :return: (Tuple[int, Optional[EndTime]]) a pair of <position to insert (if not found), matching end-time (if found)>
+    orders the end-times by time, where finish end-times precede start ones of the same time,
+        and orders the stis of every end-time by symbol
+    :param end_times: (Dict[Tuple[int, bool], EndTime]) end-times by time & type
+    :return: (List[EndTime]) ordered end-time list
     """
 
-    min_index: int = 0
-    max_index: int = len(end_time_list) - 1
-
-    while min_index <= max_index:
-        mid_index = (min_index + max_index) // 2
-        diff: int = end_time.compare(end_time_list[mid_index])
-        if diff == 0:
-            return -1, end_time_list[mid_index]
-        elif diff < 0:
-            max_index = mid_index - 1
-        else:
-            min_index = mid_index + 1
-
-    return min_index, None
+    # finish (False) precedes start (True) within the same time
+    end_time_list: List[EndTime] = [end_time for _, end_time in sorted(end_times.items())]
+    for end_time in end_time_list:
+        # most end-times hold a single sti, which needs no ordering
+        if len(end_time.stis) > 1:
+            end_time.stis.sort(key=__STI_SYMBOL_KEY)
+    return end_time_list
 
 
 def __convert_event_seq_to_coincidence_seq(
@@ -1,17 +1,28 @@
-from typing import List, Dict
+from typing import List, Dict, Set, Optional
 from tirpclo.data_types import Tiep
+from tirpclo import constants
 
 
 class MasterTiep:
     """this class represents a Master Tiep, i.e., a data structure
 
     Attributes:  # noqa
+        rep_id: (int) id of the master tiep's tiep representation
+        symbol: (int) symbol of the master tiep's tiep representation
+        complement_rep_id: (int) id of the complementing tiep representation, i.e., of the finish tiep
+            for a start tiep and vice versa
         tiep_occurrences: (Dict[str, List[Tiep]]) all tiep instances by entity ID
         supporting_entities: (List[str]) list of supporting entities
+        coincidence_indices: (Dict[str, List[int]]) coincidence index of every tiep instance by entity ID,
+            built upon first use
     """
-    def __init__(self):
+    def __init__(self, rep_id: int, symbol: int, complement_rep_id: int):
+        self.rep_id: int = rep_id
+        self.symbol: int = symbol
+        self.complement_rep_id: int = complement_rep_id
         self.tiep_occurrences: Dict[str, List[Tiep]] = {}
         self.supporting_entities: List[str] = []
+        self.coincidence_indices: Dict[str, List[int]] = {}
 
     def add_occurrence(self, entity: str, tiep: Tiep) -> int:
         """
@@ -21,19 +32,66 @@ class MasterTiep:
         :return: (int) tiep instance index within entity
         """
 
-        if entity not in self.tiep_occurrences:
-            self.tiep_occurrences[entity] = []
+        entity_tiep_instances: Optional[List[Tiep]] = self.tiep_occurrences.get(entity)
+        if entity_tiep_instances is None:
+            entity_tiep_instances = self.tiep_occurrences[entity] = []
             self.supporting_entities.append(entity)
 
-        tiep.entity_tiep_index = len(self.tiep_occurrences[entity])
-        self.tiep_occurrences[entity].append(tiep)
+        tiep.entity_tiep_index = len(entity_tiep_instances)
+        entity_tiep_instances.append(tiep)
 
         return tiep.entity_tiep_index
 
+    def get_coincidence_indices(self, entity: str) -> List[int]:
+        """
+        returns the (non-decreasing) coincidence indices of the tiep instances within a specific entity;
+            must only be used once the initial sequence database has been filtered from infrequent tieps,
+            which re-indexes its coincidences
+        :param entity: (str) entity ID
+        :return: (List[int]) coincidence index of every tiep instance within the entity
+        """
+
+        if entity not in self.coincidence_indices:
+            self.coincidence_indices[entity] = [tiep.coincidence.index for tiep in self.tiep_occurrences[entity]]
+        return self.coincidence_indices[entity]
+
 
 class TiepIndex:
+    """this class represents a Tiep Index, i.e., a mapping of every tiep to its master tiep
+
+    Attributes:  # noqa
+        master_tieps: (Dict[str, MasterTiep]) master tiep of each tiep representation
+        rep_ids: (Dict[str, int]) dense id of each tiep representation, either primitive or
+            co-occurrence / meet one
+        reps: (List[str]) tiep representation of each id
+        primitive_rep_ids: (List[int]) id of the primitive form of each tiep representation by its id
+        master_tieps_list: (List[Optional[MasterTiep]]) master tiep of each tiep representation by its id
+            (None for a co-occurrence / meet tiep representation or one whose master tiep has been removed)
+    """
     def __init__(self):
         self.master_tieps: Dict[str, MasterTiep] = {}
+        self.rep_ids: Dict[str, int] = {}
+        self.reps: List[str] = []
+        self.primitive_rep_ids: List[int] = []
+        self.master_tieps_list: List[Optional[MasterTiep]] = []
+
+    def get_rep_id(self, tiep_rep: str, primitive_rep_id: int = -1) -> int:
+        """
+        returns the id of a tiep representation, assigning a new one upon first sight
+        :param tiep_rep: (str) tiep representation
+        :param primitive_rep_id: (int) id of the primitive form of the tiep representation
+            (-1 for a primitive tiep representation)
+        :return: (int) tiep representation id
+        """
+
+        tiep_rep_id: Optional[int] = self.rep_ids.get(tiep_rep)
+        if tiep_rep_id is None:
+            tiep_rep_id = len(self.reps)
+            self.rep_ids[tiep_rep] = tiep_rep_id
+            self.reps.append(tiep_rep)
+            self.primitive_rep_ids.append(tiep_rep_id if primitive_rep_id == -1 else primitive_rep_id)
+            self.master_tieps_list.append(None)
+        return tiep_rep_id
 
     def add_tiep_occurrence(self, tiep_rep: str, entity: str, tiep: Tiep) -> int:
         """
@@ -44,7 +102,37 @@ class TiepIndex:
         :return: (int) tiep instance index within entity
         """
 
-        if tiep_rep not in self.master_tieps:
-            self.master_tieps[tiep_rep] = MasterTiep()
+        tiep_rep_id: int = self.get_rep_id(tiep_rep)
+        master_tiep: Optional[MasterTiep] = self.master_tieps_list[tiep_rep_id]
+        if master_tiep is None:
+            complement_rep: str = tiep_rep[:-1] + \
+                (constants.FINISH_REP if tiep_rep[-1] == constants.START_REP else constants.START_REP)
+            master_tiep = MasterTiep(tiep_rep_id, tiep.symbol, self.get_rep_id(complement_rep))
+            self.master_tieps_list[tiep_rep_id] = master_tiep
+            self.master_tieps[tiep_rep] = master_tiep
+
+        tiep.primitive_rep_id = tiep_rep_id
+        tiep.co_rep_id = self.get_rep_id(tiep.co_rep, tiep_rep_id)
+        tiep.meet_rep_id = self.get_rep_id(tiep.meet_rep, tiep_rep_id)
+        return master_tiep.add_occurrence(entity, tiep)
+
+    def remove_infrequent_master_tieps(self, min_support: int) -> None:
+        """
+        removes the master tieps of all infrequent tiep representations
+        :param min_support: (int) minimum vertical support threshold
+        :return: (None)
+        """
+
+        self.master_tieps = {
+            tiep_rep: master_tiep for tiep_rep, master_tiep in self.master_tieps.items()
+            if len(master_tiep.supporting_entities) >= min_support
+        }
+        self.master_tieps_list = [self.master_tieps.get(tiep_rep) for tiep_rep in self.reps]
+
+    def get_master_tiep_ids(self) -> Set[int]:
+        """
+        returns the ids of all tiep representations currently having a master tiep
+        :return: (Set[int]) ids of tiep representations having a master tiep
+        """
 
-        return self.master_tieps[tiep_rep].add_occurrence(entity, tiep)
+        return {tiep_rep_id for tiep_rep_id, master_tiep in enumerate(self.master_tieps_list) if master_tiep is not None}
@@ -1,8 +1,12 @@
-from typing.io import TextIO
-from typing import List
-from tirpclo.data_types import STI, SequenceDB
+from typing import List, Tuple, TextIO
+from operator import attrgetter
+from itertools import islice
+from tirpclo.data_types import STI, Tiep, CoincidenceSequence, PatternInstance, SequenceDB
 from tirpclo import constants
 
+# order of the STIs of a TIRP instance, by start-time, finish-time and symbol
+__STI_ORDER_KEY = attrgetter('start_time', 'finish_time', 'symbol', 'entity_sti_index')
+
 
 def write_tirp(
         seq_db: SequenceDB,
@@ -15,31 +19,31 @@ def write_tirp(
     :return: (None)
     """
 
+    db: List[Tuple[CoincidenceSequence, PatternInstance]] = seq_db.db
     support: int = seq_db.support
-    length: int = len(seq_db.db[0][1].tieps) // 2
-    stis: List[STI] = [tiep.sti for tiep in seq_db.db[0][1].tieps if tiep.type == constants.START_REP]
-    stis.sort()
-
-    tirp_text_representation = f"{length} "
-    tirp_text_representation += "-".join([f"{sti.symbol}" for sti in stis]) + " "
-
-    if length == 1:
-        tirp_text_representation += "-."
-    else:
-        for i in range(length):
-            for j in range(i + 1, length):
-                tirp_text_representation += __get_relation(stis[i], stis[j]) + "."
+    start_rep: str = constants.START_REP
+    first_coincidence_seq, first_pattern_instance = db[0]
+    first_tieps: List[Tiep] = first_pattern_instance.tieps
+    length: int = len(first_tieps) >> 1
+    stis: List[STI] = [tiep.sti for tiep in first_tieps if tiep.type == start_rep]
+    stis.sort(key=__STI_ORDER_KEY)
 
-    tirp_text_representation += f" {support} "
-    tirp_text_representation += f"{support if length == 1 else round(len(seq_db.db) / support, 2)} "
-    tirp_text_representation += f"{seq_db.db[0][0].entity} {__get_stis_as_str(stis)} "
+    # the space-separated parts of the TIRP's text representation
+    tirp_text_parts: List[str] = [
+        f"{length}",
+        "-".join([f"{sti.symbol}" for sti in stis]),
+        "-." if length == 1 else __get_relations_as_str(stis),
+        f"{support}",
+        f"{support if length == 1 else round(len(db) / support, 2)}",
+        f"{first_coincidence_seq.entity} {__get_stis_as_str(stis)}"
+    ]
 
-    for i in range(1, len(seq_db.db)):
-        stis = [tiep.sti for tiep in seq_db.db[i][1].tieps if tiep.type == constants.START_REP]
-        stis.sort()
-        tirp_text_representation += f"{seq_db.db[i][0].entity} {__get_stis_as_str(stis)} "
+    for coincidence_seq, pattern_instance in islice(db, 1, None):
+        stis = [tiep.sti for tiep in pattern_instance.tieps if tiep.type == start_rep]
+        stis.sort(key=__STI_ORDER_KEY)
+        tirp_text_parts.append(f"{coincidence_seq.entity} {__get_stis_as_str(stis)}")
 
-    out_file.write(f'{tirp_text_representation[: -1]}\n')
+    out_file.write(" ".join(tirp_text_parts) + "\n")
 
 
 def __get_stis_as_str(
@@ -51,30 +55,57 @@ def __get_stis_as_str(
     :return: (str) string representation of stis
     """
 
-    return "".join([repr(sti) for sti in stis])
+    return "".join(map(repr, stis))
+
+
+def __get_relations_as_str(
+        stis: List[STI]
+) -> str:
+    """
+    returns string representation of the temporal relations between every pair of ordered stis
+    :param stis: (List[STI]) ordered list of stis
+    :return: (str) string representation of the temporal relations
+    """
+
+    get_relation = __get_relation
+    relations: List[str] = []
+    for i, sti in enumerate(stis):
+        start_time: int = sti.start_time
+        finish_time: int = sti.finish_time
+        relations.extend([
+            get_relation(start_time, finish_time, other_sti.start_time, other_sti.finish_time)
+            for other_sti in stis[i + 1:]
+        ])
+    return ".".join(relations) + "."
 
 
 def __get_relation(
-        sti1: STI,
-        sti2: STI
+        start_time1: int,
+        finish_time1: int,
+        start_time2: int,
+        finish_time2: int
 ) -> str:
     """
-    returns temporal relation between two STIs
-    :param sti1: (STI) first STI
-    :param sti2: (STI) second STI
+    returns temporal relation between two STIs, given by their end-points
+    :param start_time1: (int) start-time of first STI
+    :param finish_time1: (int) finish-time of first STI
+    :param start_time2: (int) start-time of second STI
+    :param finish_time2: (int) finish-time of second STI
     :return: (str) temporal relation
     """
 
-    if sti1.finish_time < sti2.start_time:
+    if finish_time1 < start_time2:
         return constants.ALLEN_BEFORE
-    if sti1.finish_time == sti2.start_time:
+    if finish_time1 == start_time2:
         return constants.ALLEN_MEET
-    if sti1.start_time == sti2.start_time and sti1.finish_time == sti2.finish_time:
-        return constants.ALLEN_EQUAL
-    if sti1.start_time < sti2.start_time and sti1.finish_time > sti2.finish_time:
-        return constants.ALLEN_CONTAIN
-    if sti1.start_time == sti2.start_time and sti1.finish_time < sti2.finish_time:
-        return constants.ALLEN_STARTS
-    if sti1.start_time < sti2.start_time and sti1.finish_time == sti2.finish_time:
-        return constants.ALLEN_FINISHBY
+    if start_time1 == start_time2:
+        if finish_time1 == finish_time2:
+            return constants.ALLEN_EQUAL
+        if finish_time1 < finish_time2:
+            return constants.ALLEN_STARTS
+    elif start_time1 < start_time2:
+        if finish_time1 > finish_time2:
+            return constants.ALLEN_CONTAIN
+        if finish_time1 == finish_time2:
+            return constants.ALLEN_FINISHBY
     return constants.ALLEN_OVERLAP
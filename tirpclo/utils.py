@@ -1,12 +1,14 @@
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, TextIO
 from dataclasses import dataclass
-from typing.io import TextIO
 from pathlib import Path
-import distutils.util
 import argparse
 from tirpclo.data_types import Tiep, STI
 from tirpclo import constants
 
+# accepted representations of boolean arguments, as formerly accepted by distutils.util.strtobool
+__TRUE_VALUES = ('y', 'yes', 't', 'true', 'on', '1')
+__FALSE_VALUES = ('n', 'no', 'f', 'false', 'off', '0')
+
 
 @dataclass
 class RunConfig:
@@ -19,6 +21,7 @@ class RunConfig:
         maximal_gap: (int) maximal gap
         in_file_path: (str) path to input file
         out_file_path: (str) path to output file
+        num_workers: (int) number of worker processes used for mining
     """
     is_closed_tirp_mining: bool
     num_entities: int
@@ -26,6 +29,7 @@ class RunConfig:
     maximal_gap: int
     in_file_path: str
     out_file_path: Optional[str] = None
+    num_workers: int = 1
 
     def __post_init__(self):
         if self.out_file_path is None:
@@ -41,7 +45,7 @@ def parse_arguments(
 
     parser = argparse.ArgumentParser()
     parser.add_argument(
-        '-c', '--is_closed_tirp_mining', type=lambda x: bool(distutils.util.strtobool(x)), required=True
+        '-c', '--is_closed_tirp_mining', type=__str_to_bool, required=True
     )
     parser.add_argument(
         '-n', '--num_entities', type=int, required=True
@@ -55,12 +59,32 @@ def parse_arguments(
     parser.add_argument(
         '-f', '--in_file_path', type=str, required=True
     )
+    parser.add_argument(
+        '-w', '--num_workers', type=int, default=1
+    )
 
     parsed_args = parser.parse_args()
 
     return parsed_args.__dict__
 
 
+def __str_to_bool(
+        value: str
+) -> bool:
+    """
+    converts a boolean argument into a bool
+    :param value: (str) boolean argument, e.g., true / false, yes / no or 1 / 0 (case-insensitive)
+    :return: (bool) converted boolean argument
+    """
+
+    value = value.lower()
+    if value in __TRUE_VALUES:
+        return True
+    if value in __FALSE_VALUES:
+        return False
+    raise ValueError(f'invalid truth value {value!r}')
+
+
 def out_file_set_up(
         out_file_path: str
 ) -> TextIO:
@@ -115,13 +139,15 @@ def generate_sorted_output_file(
     :return: (None)
     """
 
-    with open(out_file_path, 'r') as out_file:
-        output_lines: List[str] = out_file.readlines()
+    # the lines are sorted as raw bytes, whose utf-8 order matches the order of the decoded lines
+    with open(out_file_path, 'rb') as out_file:
+        output_lines: List[bytes] = out_file.read().splitlines(keepends=True)
 
     output_lines.sort()
     sorted_out_file_path = get_sorted_output_file_name(out_file_path)
 
-    open(sorted_out_file_path, 'w').writelines(output_lines)
+    with open(sorted_out_file_path, 'wb') as sorted_out_file:
+        sorted_out_file.writelines(output_lines)
 
 
 def get_stats_output_file_name(